@@ -0,0 +1,160 @@
+import argparse
+import json
+import platform
+import time
+import tracemalloc
+
+from benchmark import git_revision, opening_coins
+from coin import Coin, CoinSet
+from physics import COIN_RADIUS
+
+def dict_coins():
+    # The per-coin dicts CarromGame kept before the Coin type.
+    coins = []
+    for index, coin in enumerate(opening_coins()):
+        coins.append({
+            'id': index + 1,
+            'x': coin['x'],
+            'y': coin['y'],
+            'radius': COIN_RADIUS,
+            'vx': 0.0,
+            'vy': 0.0,
+            'moving': False,
+            'type': coin['type'],
+            'initial_dx': 0.0,
+            'initial_dy': 0.0
+        })
+    return coins
+
+def slot_coins():
+    return [Coin(index + 1, coin['x'], coin['y'], coin['type'], COIN_RADIUS)
+            for index, coin in enumerate(opening_coins())]
+
+def dict_read(coins):
+    total = 0.0
+    for coin in coins:
+
+        if coin['type'] == 'white':
+            total += coin['x'] + coin['y'] + coin['vx'] + coin['vy'] + coin['radius']
+    return total
+
+def slot_read(coins):
+    total = 0.0
+    for coin in coins:
+
+        if coin.type == 'white':
+            total += coin.x + coin.y + coin.vx + coin.vy + coin.radius
+    return total
+
+def dict_move(coins):
+    for coin in coins:
+
+        if coin.get('pocketed'):
+            continue
+        coin['x'] += coin['vx']
+        coin['y'] += coin['vy']
+        coin['vx'] *= 0.98
+        coin['vy'] *= 0.98
+
+def slot_move(coins):
+    for coin in coins:
+
+        if coin.pocketed:
+            continue
+        coin.x += coin.vx
+        coin.y += coin.vy
+        coin.vx *= 0.98
+        coin.vy *= 0.98
+
+def coin_set():
+    return CoinSet(slot_coins())
+
+def dict_count(coins):
+    return sum(1 for coin in coins if coin['type'] == 'white' and not coin.get('pocketed'))
+
+def set_count(coins):
+    return coins.count('white')
+
+def dict_moving(coins):
+    return any(coin['moving'] for coin in coins)
+
+def set_moving(coins):
+    return coins.any_moving()
+
+def copy_all(coins):
+    return [coin.copy() for coin in coins]
+
+# Field reads, field writes and whole-coin copies: the per-coin work the
+# board does, with nothing indexed on either side.
+PATTERNS = {
+    'read': (dict_read, slot_read),
+    'move': (dict_move, slot_move),
+    'copy': (copy_all, copy_all)
+}
+
+# The board questions CoinSet answers from its counts, against scanning
+# the dicts.
+QUERIES = {
+    'count': (dict_count, set_count),
+    'moving': (dict_moving, set_moving)
+}
+
+def time_pattern(function, coins, repeat):
+    started = time.perf_counter()
+    for _ in range(repeat):
+        function(coins)
+    return (time.perf_counter() - started) / repeat / len(coins) * 1e9
+
+def memory_per_coin(build, boards):
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    kept = [build() for _ in range(boards)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    # The list of boards and the board lists are the same for both kinds;
+    # the coin x, y and type values are shared with opening_coins either way.
+    return (after - before) / sum(len(board) for board in kept)
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark Coin objects against the per-coin dicts they replaced.")
+    parser.add_argument('--output', default='bench_coin.json')
+    parser.add_argument('--repeat', type=int, default=20000)
+    parser.add_argument('--boards', type=int, default=1000)
+    args = parser.parse_args()
+    report = {
+        'revision': git_revision(),
+        'python': platform.python_version(),
+        'repeat': args.repeat,
+        'memory_bytes_per_coin': {
+            'dict': memory_per_coin(dict_coins, args.boards),
+            'slots': memory_per_coin(slot_coins, args.boards),
+            'coin_set': memory_per_coin(coin_set, args.boards)
+        },
+        'patterns_ns_per_coin': {},
+        'queries_ns_per_coin': {}
+    }
+    for name, (dict_function, slot_function) in PATTERNS.items():
+        result = {
+            'dict': time_pattern(dict_function, dict_coins(), args.repeat),
+            'slots': time_pattern(slot_function, slot_coins(), args.repeat)
+        }
+        report['patterns_ns_per_coin'][name] = result
+        print(f"{name:8} {result['dict']:8.1f}ns dict {result['slots']:8.1f}ns slots "
+              f"{result['dict'] / result['slots']:6.2f}x")
+    for name, (dict_function, set_function) in QUERIES.items():
+        result = {
+            'dict': time_pattern(dict_function, dict_coins(), args.repeat),
+            'coin_set': time_pattern(set_function, coin_set(), args.repeat)
+        }
+        report['queries_ns_per_coin'][name] = result
+        print(f"{name:8} {result['dict']:8.1f}ns dict {result['coin_set']:8.1f}ns set   "
+              f"{result['dict'] / result['coin_set']:6.2f}x")
+    memory = report['memory_bytes_per_coin']
+    print(f"memory   {memory['dict']:8.0f}B dict  {memory['slots']:8.0f}B slots {memory['coin_set']:6.0f}B in a set")
+
+    with open(args.output, 'w') as f:
+        json.dump(report, f, indent=4)
+    print(f"Wrote {args.output}")
+
+if __name__ == "__main__":
+    main()
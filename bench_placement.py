@@ -0,0 +1,111 @@
+import argparse
+import json
+import math
+import platform
+import random
+import time
+
+from benchmark import CENTER_CIRCLE_RADIUS, CENTER_X, CENTER_Y, git_revision, percentile, scenarios
+from coin import Coin
+from physics import COIN_RADIUS
+from placement import CentrePlacement
+
+CLEARANCES = {
+    'coin': COIN_RADIUS * 2,
+    'queen': COIN_RADIUS * 2.5
+}
+FILL_COUNT = 8
+
+def board_coins(coins):
+    return [Coin(index + 1, coin['x'], coin['y'], coin['type'], COIN_RADIUS) for index, coin in enumerate(coins)]
+
+def is_free(coins, x, y, clearance):
+    for coin in coins:
+
+        if math.hypot(x - coin.x, y - coin.y) < clearance:
+            return False
+    return True
+
+def sample_spot(coins, clearance, generator):
+    # The rejection sampling CarromGame used before the placement service:
+    # 100 random draws in the centre circle, then the centre regardless.
+    for _ in range(100):
+        angle = generator.uniform(0, 2 * math.pi)
+        distance = generator.uniform(0, CENTER_CIRCLE_RADIUS)
+        x = CENTER_X + distance * math.cos(angle)
+        y = CENTER_Y + distance * math.sin(angle)
+
+        if is_free(coins, x, y, clearance):
+            return x, y, True
+    return CENTER_X, CENTER_Y, False
+
+def service_spot(placement, coins, clearance):
+    x, y = placement.place(coins, clearance)
+    return x, y, is_free(coins, x, y, clearance)
+
+def fill(coins, clearance, repeat, spot):
+    # Places FILL_COUNT coins one after another, the way repeated fouls
+    # crowd the centre, and times every placement.
+    latencies = []
+    overlaps = 0
+    distances = []
+    for _ in range(repeat):
+        board = board_coins(coins)
+        for _ in range(FILL_COUNT):
+            started = time.perf_counter()
+            x, y, free = spot(board, clearance)
+            latencies.append(time.perf_counter() - started)
+            overlaps += not free
+            distances.append(math.hypot(x - CENTER_X, y - CENTER_Y))
+            board.append(Coin(len(board) + 1, x, y, 'white', COIN_RADIUS))
+    return {
+        'placements': len(latencies),
+        'overlaps': overlaps,
+        'mean_distance': sum(distances) / len(distances),
+        'latency_us': {
+            'mean': sum(latencies) / len(latencies) * 1e6,
+            'p50': percentile(latencies, 0.50) * 1e6,
+            'p99': percentile(latencies, 0.99) * 1e6,
+            'max': max(latencies) * 1e6
+        }
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark centre placement for penalty coins and the queen.")
+    parser.add_argument('--output', default='bench_placement.json')
+    parser.add_argument('--repeat', type=int, default=20)
+    parser.add_argument('--scenario', action='append', help="run only these scenarios")
+    args = parser.parse_args()
+    placement = CentrePlacement(CENTER_X, CENTER_Y)
+    report = {
+        'revision': git_revision(),
+        'python': platform.python_version(),
+        'repeat': args.repeat,
+        'fill_count': FILL_COUNT,
+        'scenarios': {}
+    }
+    for name, coins in scenarios().items():
+
+        if args.scenario and name not in args.scenario:
+            continue
+        results = {}
+        for kind, clearance in CLEARANCES.items():
+            generator = random.Random(name)
+            results[kind] = {
+                'sampling': fill(coins, clearance, args.repeat,
+                                 lambda board, clearance: sample_spot(board, clearance, generator)),
+                'service': fill(coins, clearance, args.repeat,
+                                lambda board, clearance: service_spot(placement, board, clearance))
+            }
+            for method, result in results[kind].items():
+                print(f"{name:16} {kind:5} {method:8} {result['latency_us']['mean']:8.0f}us mean "
+                      f"{result['latency_us']['max']:8.0f}us max  {result['overlaps']:4} overlaps  "
+                      f"{result['mean_distance']:6.1f}px from centre")
+        report['scenarios'][name] = results
+
+    with open(args.output, 'w') as f:
+        json.dump(report, f, indent=4)
+    print(f"Wrote {args.output}")
+
+if __name__ == "__main__":
+    main()
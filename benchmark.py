@@ -0,0 +1,198 @@
+import argparse
+import json
+import math
+import platform
+import random
+import subprocess
+import time
+
+from physics import BoardSimulation, BOARD_SIZE, COIN_RADIUS, POCKET_POSITIONS, STRIKER_RADIUS, STRIKER_Y, np
+
+CENTER_X = BOARD_SIZE // 2
+CENTER_Y = BOARD_SIZE // 2
+CENTER_CIRCLE_RADIUS = 60
+OPENING_ANGLES = [0, 45, 90, 135]
+SHOTS = [
+    (300, -math.pi / 2, 35),
+    (300, -math.pi / 2, 20),
+    (220, -1.3, 30),
+    (380, -1.85, 30),
+    (160, -0.9, 25),
+    (440, -2.25, 25),
+    (260, -1.45, 12),
+    (340, -1.7, 35)
+]
+
+def opening_coins(angle=0):
+    # Same layout as CarromGame.place_coins, turned the way rotate_coins does.
+    spacing = COIN_RADIUS * 2 + 2
+    base_angle_deg = 30
+    coins = [{'x': CENTER_X, 'y': CENTER_Y, 'type': 'red'}]
+    directions = []
+    for i in range(6):
+        angle_rad = math.radians(base_angle_deg + i * 60)
+        directions.append((math.cos(angle_rad), math.sin(angle_rad)))
+    relative_positions = []
+    for layer in range(1, 3):
+        angle_start = math.radians(base_angle_deg + 4 * 60)
+        x = math.cos(angle_start) * spacing * layer
+        y = math.sin(angle_start) * spacing * layer
+        for dx, dy in directions:
+            for _ in range(layer):
+                relative_positions.append((x, y))
+                x += dx * spacing
+                y += dy * spacing
+    cos_a = math.cos(math.radians(angle))
+    sin_a = math.sin(math.radians(angle))
+    for i, (rel_x, rel_y) in enumerate(relative_positions):
+        coins.append({
+            'x': CENTER_X + rel_x * cos_a - rel_y * sin_a,
+            'y': CENTER_Y + rel_x * sin_a + rel_y * cos_a,
+            'type': 'white' if i % 2 == 0 else 'black'
+        })
+    return coins
+
+def is_free(coins, x, y, clearance=COIN_RADIUS * 2):
+    for coin in coins:
+
+        if math.hypot(x - coin['x'], y - coin['y']) < clearance:
+            return False
+    return True
+
+def scatter_coins(counts, seed):
+    generator = random.Random(seed)
+    low = 70
+    high = BOARD_SIZE - 70
+    coins = []
+    for kind, count in counts:
+
+        while count:
+            x = generator.uniform(low, high)
+            y = generator.uniform(low, STRIKER_Y - STRIKER_RADIUS - COIN_RADIUS - 4)
+            near_pocket = any(math.hypot(x - px, y - py) < 60 for px, py in POCKET_POSITIONS)
+
+            if not near_pocket and is_free(coins, x, y):
+                coins.append({'x': x, 'y': y, 'type': kind})
+                count -= 1
+    return coins
+
+def add_penalty_coins(coins, kind, count, seed):
+    # Mirrors place_penalty_coin: random spots in the centre circle, and
+    # the centre itself once the circle is full.
+    generator = random.Random(seed)
+    coins = list(coins)
+    for _ in range(count):
+        for _ in range(100):
+            angle = generator.uniform(0, 2 * math.pi)
+            distance = generator.uniform(0, CENTER_CIRCLE_RADIUS)
+            x = CENTER_X + distance * math.cos(angle)
+            y = CENTER_Y + distance * math.sin(angle)
+
+            if is_free(coins, x, y):
+                coins.append({'x': x, 'y': y, 'type': kind})
+                break
+    return coins
+
+def scenarios():
+    boards = {}
+    for angle in OPENING_ANGLES:
+        boards[f'opening_{angle}'] = opening_coins(angle)
+    boards['midgame_scatter'] = scatter_coins([('white', 5), ('black', 5), ('red', 1)], seed=11)
+    boards['crowded_centre'] = add_penalty_coins(
+        scatter_coins([('white', 4), ('black', 4)], seed=12), 'white', 6, seed=13
+    )
+    boards['late_game'] = scatter_coins([('white', 1), ('black', 2)], seed=14)
+    return boards
+
+def percentile(samples, fraction):
+    ordered = sorted(samples)
+
+    if not ordered:
+        return 0.0
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+def bench_scenario(coins, repeat, engine, **options):
+    simulation = BoardSimulation(**options)
+    latencies = []
+    ticks = 0
+    shots = 0
+    started = time.perf_counter()
+    for _ in range(repeat):
+        for striker_x, angle, power in SHOTS:
+            simulation.reset(coins, striker_x, STRIKER_Y)
+            simulation.strike(power * math.cos(angle), power * math.sin(angle))
+
+            if engine == 'events':
+                simulation.run_events()
+            else:
+
+                while simulation.running:
+                    tick_started = time.perf_counter()
+                    simulation.step()
+                    latencies.append(time.perf_counter() - tick_started)
+            ticks += simulation.ticks
+            shots += 1
+    elapsed = time.perf_counter() - started
+    result = {
+        'coins': len(coins),
+        'shots': shots,
+        'ticks': ticks,
+        'seconds': elapsed,
+        'steps_per_sec': ticks / elapsed,
+        'shots_per_sec': shots / elapsed
+    }
+
+    if latencies:
+        result['step_latency_us'] = {
+            'p50': percentile(latencies, 0.50) * 1e6,
+            'p90': percentile(latencies, 0.90) * 1e6,
+            'p99': percentile(latencies, 0.99) * 1e6,
+            'max': max(latencies) * 1e6
+        }
+    return result
+
+def git_revision():
+
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True,
+                              text=True, check=True).stdout.strip()
+
+    except Exception:
+        return None
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the headless carrom physics.")
+    parser.add_argument('--output', default='benchmark.json')
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--engine', choices=['tick', 'events'], default='tick')
+    parser.add_argument('--scenario', action='append', help="run only these scenarios")
+    parser.add_argument('--vectorized', choices=['auto', 'on', 'off'], default='auto')
+    args = parser.parse_args()
+    vectorized = {'auto': None, 'on': True, 'off': False}[args.vectorized]
+    report = {
+        'revision': git_revision(),
+        'python': platform.python_version(),
+        'numpy': np.__version__ if np is not None else None,
+        'engine': args.engine,
+        'vectorized': args.vectorized,
+        'repeat': args.repeat,
+        'scenarios': {}
+    }
+    for name, coins in scenarios().items():
+
+        if args.scenario and name not in args.scenario:
+            continue
+        result = bench_scenario(coins, args.repeat, args.engine, vectorized=vectorized)
+        report['scenarios'][name] = result
+        line = f"{name:18} {result['steps_per_sec']:10.0f} steps/s {result['shots_per_sec']:8.1f} shots/s"
+
+        if 'step_latency_us' in result:
+            line += f"  p50 {result['step_latency_us']['p50']:.0f}us p99 {result['step_latency_us']['p99']:.0f}us"
+        print(line)
+
+    with open(args.output, 'w') as f:
+        json.dump(report, f, indent=4)
+    print(f"Wrote {args.output}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,247 @@
+import time
+
+CATEGORIES = ('board', 'coins', 'striker', 'arc', 'aim', 'overlays')
+
+class CanvasRegistry:
+
+    def __init__(self, canvas, strict=False):
+        # Every board item is created here and filed under a category, so a
+        # new game can drop all of them instead of drawing over the old ones.
+        # strict turns a leak found by check_growth into an error; the game
+        # passes __debug__, so only optimised (-O) runs just report it.
+        self.canvas = canvas
+        self.owners = {}
+        self.categories = {category: set() for category in CATEGORIES}
+        self.baseline = None
+        self.strict = strict
+
+    def create(self, category, kind, *coords, **options):
+        item = getattr(self.canvas, 'create_' + kind)(*coords, **options)
+        self.owners[item] = category
+        self.categories[category].add(item)
+        return item
+
+    def delete(self, item):
+        category = self.owners.pop(item, None)
+
+        if category is not None:
+            self.categories[category].discard(item)
+        self.canvas.delete(item)
+
+    def clear(self, *categories):
+        for category in categories or CATEGORIES:
+            for item in list(self.categories[category]):
+                self.delete(item)
+
+    def counts(self):
+        counts = {category: len(items) for category, items in self.categories.items()}
+        counts['untracked'] = len(self.canvas.find_all()) - len(self.owners)
+        return counts
+
+    def check_growth(self):
+        # Run after a full teardown. The first game sets the baseline; any
+        # later game that leaves more items behind is leaking them.
+        live = len(self.canvas.find_all())
+
+        if self.baseline is None:
+            self.baseline = live
+
+        if live > self.baseline:
+            message = f"canvas items grew from {self.baseline} to {live}: {self.counts()}"
+
+            if self.strict:
+                raise RuntimeError(message)
+            print(f"Warning: {message}")
+        return live
+
+class RetainedRenderer:
+
+    def __init__(self, registry, request_frame=None):
+        # Items are created once and then only moved or reconfigured.
+        # Changes collect in the dirty map until flush() applies them, so a
+        # burst of motion events costs one canvas call per item per frame.
+        self.registry = registry
+        self.canvas = registry.canvas
+        self.request_frame = request_frame
+        self.items = {}
+        self.applied = {}
+        self.dirty = {}
+
+    def __contains__(self, name):
+        return name in self.items
+
+    def item(self, name):
+        return self.items.get(name)
+
+    def create(self, name, category, kind, *coords, **options):
+        item = self.registry.create(category, kind, *coords, **options)
+        self.items[name] = item
+        self.applied[name] = dict(options, coords=tuple(float(value) for value in coords))
+        self.applied[name].setdefault('state', 'normal')
+        return item
+
+    def coords(self, name):
+        changes = self.dirty.get(name, {})
+        return list(changes.get('coords', self.applied[name]['coords']))
+
+    def update(self, name, coords=None, **options):
+
+        if coords is not None:
+            options['coords'] = tuple(float(value) for value in coords)
+        applied = self.applied[name]
+        changes = self.dirty.get(name, {})
+        for key, value in options.items():
+
+            if applied.get(key) == value:
+                changes.pop(key, None)
+            else:
+                changes[key] = value
+
+        if not changes:
+            self.dirty.pop(name, None)
+            return
+
+        if not self.dirty and self.request_frame:
+            self.request_frame()
+        self.dirty[name] = changes
+
+    def show(self, name, **options):
+        self.update(name, state='normal', **options)
+
+    def hide(self, name):
+        self.update(name, state='hidden')
+
+    def flush(self):
+        touched = len(self.dirty)
+        for name, changes in self.dirty.items():
+            item = self.items[name]
+            options = dict(changes)
+            coords = options.pop('coords', None)
+
+            if coords is not None:
+                self.canvas.coords(item, *coords)
+
+            if options:
+                self.canvas.itemconfig(item, **options)
+
+            if options.get('state') == 'normal':
+                # Items that come back into view go on top, the same place
+                # a freshly created item would land.
+                self.canvas.tag_raise(item)
+            self.applied[name].update(changes)
+        self.dirty = {}
+        return touched
+
+    def delete(self, name):
+        item = self.items.pop(name, None)
+        self.applied.pop(name, None)
+        self.dirty.pop(name, None)
+
+        if item is not None:
+            self.registry.delete(item)
+
+    def clear(self):
+        for name in list(self.items):
+            self.delete(name)
+
+class OverlayLayer:
+
+    def __init__(self, renderer, scheduler, size, fade_ms=350, pulse_ms=50, frame_ms=20):
+        # One shade image and one banner image on the board canvas, reused by
+        # every overlay. Fading swaps pre-blended shade frames; nothing here
+        # opens a window or changes window alpha.
+        self.renderer = renderer
+        self.scheduler = scheduler
+        self.size = size
+        self.fade_ms = fade_ms
+        self.pulse_ms = pulse_ms
+        self.frame_ms = frame_ms
+        self.task_id = None
+        self.shade = []
+        self.banner = []
+        self.level = 0
+        self.started = 0.0
+        self.hold_ms = None
+        self.fading_out = False
+        self.on_hidden = None
+        self.visible = False
+
+    def show(self, shade, banner, hold_ms=None, on_hidden=None):
+        self.cancel()
+        self.shade = shade
+        self.banner = banner
+        self.level = 0
+        self.started = time.perf_counter()
+        self.hold_ms = hold_ms
+        self.on_hidden = on_hidden
+        self.place('overlay_shade', (0, 0), shade[0], 'nw')
+        self.place('overlay_banner', (self.size[0] / 2, self.size[1] / 2), banner[0], 'center')
+        self.visible = True
+        self.task_id = self.scheduler.every(self.frame_ms, self.animate)
+
+    def place(self, name, coords, image, anchor):
+
+        if name in self.renderer:
+            self.renderer.show(name, coords=coords, image=image)
+        else:
+            self.renderer.create(name, 'overlays', 'image', *coords, image=image, anchor=anchor, tags='overlay')
+
+    def hide(self, on_hidden=None):
+
+        if on_hidden:
+            self.on_hidden = on_hidden
+
+        if not self.visible:
+            self.finish()
+            return
+        self.scheduler.cancel(self.task_id)
+        self.fading_out = True
+        self.started = time.perf_counter()
+        self.task_id = self.scheduler.every(self.frame_ms, self.animate)
+
+    def animate(self):
+        elapsed = (time.perf_counter() - self.started) * 1000
+        progress = min(1.0, elapsed / self.fade_ms)
+
+        if self.fading_out:
+
+            if progress >= 1.0:
+                self.finish()
+                return False
+            level = round(self.level * (1 - progress))
+            step = len(self.banner) - 1
+        else:
+            self.level = level = round(progress * (len(self.shade) - 1))
+            step = min(int(elapsed / self.pulse_ms), len(self.banner) - 1)
+        self.renderer.update('overlay_shade', image=self.shade[level])
+        self.renderer.update('overlay_banner', image=self.banner[step])
+        # Coins placed while an overlay is up must not land on top of it.
+        self.renderer.canvas.tag_raise('overlay')
+
+        if self.fading_out or progress < 1.0 or step < len(self.banner) - 1:
+            return
+        self.task_id = None
+
+        if self.hold_ms is not None:
+            self.task_id = self.scheduler.after(max(0, self.hold_ms - elapsed), self.hide)
+        return False
+
+    def finish(self):
+        on_hidden = self.on_hidden
+        self.cancel()
+
+        if on_hidden:
+            on_hidden()
+
+    def cancel(self):
+
+        if self.task_id is not None:
+            self.scheduler.cancel(self.task_id)
+            self.task_id = None
+        for name in ('overlay_shade', 'overlay_banner'):
+
+            if name in self.renderer:
+                self.renderer.hide(name)
+        self.fading_out = False
+        self.on_hidden = None
+        self.visible = False
@@ -0,0 +1,166 @@
+import collections
+
+class Coin:
+
+    __slots__ = ('id', 'x', 'y', 'radius', 'vx', 'vy', '_moving', 'type', '_pocketed', 'initial_dx', 'initial_dy',
+                 'owner')
+
+    id: int
+    x: float
+    y: float
+    radius: float
+    vx: float
+    vy: float
+    _moving: bool
+    type: str
+    _pocketed: bool
+    initial_dx: float
+    initial_dy: float
+    owner: 'CoinSet | None'
+
+    def __init__(self, id, x, y, type, radius=12, vx=0.0, vy=0.0, moving=False, pocketed=False,
+                 initial_dx=0.0, initial_dy=0.0):
+        self.id = id
+        self.x = x
+        self.y = y
+        self.type = type
+        self.radius = float(radius)
+        self.vx = float(vx)
+        self.vy = float(vy)
+        self._moving = bool(moving)
+        self._pocketed = bool(pocketed)
+        self.initial_dx = float(initial_dx)
+        self.initial_dy = float(initial_dy)
+        self.owner = None
+
+    # The two flags a CoinSet counts report their changes to it, so no
+    # caller has to keep the counts in step by hand. The owner slot is the
+    # price of that: one pointer, 8 bytes a coin.
+    def set_flag(self, slot, value):
+        value = bool(value)
+
+        if value == getattr(self, slot):
+            return
+
+        if self.owner is not None:
+            self.owner.unindex(self)
+        setattr(self, slot, value)
+
+        if self.owner is not None:
+            self.owner.index(self)
+
+    @property
+    def pocketed(self):
+        return self._pocketed
+
+    @pocketed.setter
+    def pocketed(self, value):
+        self.set_flag('_pocketed', value)
+
+    @property
+    def moving(self):
+        return self._moving
+
+    @moving.setter
+    def moving(self, value):
+        self.set_flag('_moving', value)
+
+    def copy(self):
+        # The fields are already coerced, so skip __init__. The copy belongs
+        # to no CoinSet until it is appended to one. This is still about 3x
+        # slower than dict.copy(), a dozen slot stores against one C call;
+        # the game only copies the coin it keeps for a queen cover.
+        coin = Coin.__new__(Coin)
+        coin.id = self.id
+        coin.x = self.x
+        coin.y = self.y
+        coin.type = self.type
+        coin.radius = self.radius
+        coin.vx = self.vx
+        coin.vy = self.vy
+        coin._moving = self._moving
+        coin._pocketed = self._pocketed
+        coin.initial_dx = self.initial_dx
+        coin.initial_dy = self.initial_dy
+        coin.owner = None
+        return coin
+
+    def to_dict(self):
+        return {'x': self.x, 'y': self.y, 'type': self.type}
+
+    def __repr__(self):
+        return f"Coin({self.type!r}, x={self.x:.1f}, y={self.y:.1f}, pocketed={self.pocketed})"
+
+class CoinSet:
+
+    def __init__(self, coins=()):
+        # The board's coins in placement order, plus counts that change only
+        # when a coin is added, removed, pocketed, put back, starts or stops.
+        # Counts rather than sets of coins keep the per-coin cost down.
+        self.coins = []
+        self.counts = collections.Counter()
+        self.moving = 0
+        for coin in coins:
+            self.append(coin)
+
+    def __iter__(self):
+        return iter(self.coins)
+
+    def __len__(self):
+        return len(self.coins)
+
+    def __getitem__(self, index):
+        return self.coins[index]
+
+    def index(self, coin):
+
+        if not coin.pocketed:
+            self.counts[coin.type] += 1
+
+        if coin.moving:
+            self.moving += 1
+
+    def unindex(self, coin):
+
+        if not coin.pocketed:
+            self.counts[coin.type] -= 1
+
+        if coin.moving:
+            self.moving -= 1
+
+    def append(self, coin):
+
+        if coin.owner is not None:
+            coin.owner.remove(coin)
+        coin.owner = self
+        self.coins.append(coin)
+        self.index(coin)
+
+    def remove(self, coin):
+        self.coins.remove(coin)
+        self.unindex(coin)
+        coin.owner = None
+
+    def remove_pocketed(self):
+        removed = [coin for coin in self.coins if coin.pocketed]
+        for coin in removed:
+            self.unindex(coin)
+            coin.owner = None
+
+        if removed:
+            self.coins = [coin for coin in self.coins if not coin.pocketed]
+        return removed
+
+    def clear(self):
+        for coin in self.coins:
+            coin.owner = None
+        self.coins = []
+        self.counts.clear()
+        self.moving = 0
+
+    def count(self, kind):
+        # Coins of this type still on the board.
+        return self.counts[kind]
+
+    def any_moving(self):
+        return self.moving > 0
@@ -0,0 +1,179 @@
+import math
+import random
+import threading
+import time
+
+from physics import BatchSimulation, BoardSimulation, BOARD_SIZE, POCKET_POSITIONS, STRIKER_RADIUS, STRIKER_Y, np
+from shot_cache import ShotCache, board_hash, canonical_coins
+from shot_evaluator import MAX_POWER, shot_velocity
+
+MIN_STRIKER_X = STRIKER_RADIUS + 126
+MAX_STRIKER_X = BOARD_SIZE - STRIKER_RADIUS - 127
+BATCH_SIZE = 64
+DIFFICULTY_LEVELS = {
+    'Easy': {'shots': 48, 'seconds': 1.5},
+    'Medium': {'shots': 480, 'seconds': 4.0},
+    'Hard': {'shots': 4800, 'seconds': 7.0}
+}
+CACHE_SEARCHES = 2
+
+def striker_is_clear(coins, x):
+    for coin in coins:
+
+        if coin.get('pocketed'):
+            continue
+
+        if math.hypot(x - coin['x'], STRIKER_Y - coin['y']) < STRIKER_RADIUS + coin.get('radius', 12):
+            return False
+    return True
+
+def score_outcome(coins, pocketed, foul, positions, rules):
+    color = rules['color']
+    opponent = 'white' if color == 'black' else 'black'
+    kinds = [coins[i]['type'] for i in pocketed]
+    own = kinds.count(color)
+    other = kinds.count(opponent)
+
+    if foul:
+        return -20 - 6 * other
+    score = 10 * own - 6 * other
+
+    if 'red' in kinds:
+        # The queen goes back to the centre when the player has no coins yet.
+        score += 12 if own or rules['score'] > 0 else -2
+
+    if rules['queen_pocketed_last_turn']:
+        score += 25 if own else -10
+    # Tie-break quiet shots by how close they leave our coins to a pocket.
+    for index, (coin, (x, y)) in enumerate(zip(coins, positions)):
+
+        if coin['type'] == color and not coin.get('pocketed') and index not in pocketed:
+            nearest = min(math.hypot(x - pocket_x, y - pocket_y) for pocket_x, pocket_y in POCKET_POSITIONS)
+            score += 0.5 * (1 - nearest / BOARD_SIZE)
+    return score
+
+class ComputerPlayer:
+
+    def __init__(self, difficulty='Medium', cache=None):
+        self.difficulty = difficulty
+        # A retried search asks the same shots in the same order, so the cache
+        # must hold a whole search or the LRU evicts each outcome before it
+        # is asked for again.
+        self.cache = cache if cache is not None else ShotCache(self.budget['shots'] * CACHE_SEARCHES)
+        self.lock = threading.Lock()
+        self.thread = None
+        self.stop_event = threading.Event()
+        self.deadline = 0
+        self.best = None
+        self.best_score = None
+        self.done = False
+        self.evaluated = 0
+
+    @property
+    def budget(self):
+        return DIFFICULTY_LEVELS[self.difficulty]
+
+    def start(self, coins, rules):
+        # The search runs on a worker thread; the Tk loop only polls best
+        # and done, so the board keeps animating while it thinks.
+        # The old search is stopped and the fields reset under the lock, and
+        # a search only writes them under the lock while its own stop_event
+        # is clear, so a stale thread can never report into this one.
+
+        with self.lock:
+            self.stop_event.set()
+            self.stop_event = threading.Event()
+            self.best = None
+            self.best_score = None
+            self.done = False
+            self.evaluated = 0
+            self.deadline = time.time() + self.budget['seconds']
+        # Coins go in canonical order so cached pocket indices stay valid
+        # for any equal board, and the candidate shots are seeded from the
+        # board so a retry of the same position asks the same questions.
+        coins = [dict(coin, vx=0.0, vy=0.0, moving=False) for coin in canonical_coins(coins)]
+        board = board_hash(coins, None, rules.get('player', 1), rules.get('queen_covered', (False, False)))
+        self.thread = threading.Thread(target=self.search, args=(coins, rules, board, self.stop_event), daemon=True)
+        self.thread.start()
+
+    def cancel(self):
+        self.stop_event.set()
+
+    def expired(self):
+        return time.time() >= self.deadline
+
+    def candidate_shots(self, coins, board):
+        count = self.budget['shots']
+        generator = random.Random(board)
+        positions = [x for x in range(MIN_STRIKER_X, MAX_STRIKER_X + 1, 8) if striker_is_clear(coins, x)]
+
+        if not positions:
+            positions = [(MIN_STRIKER_X + MAX_STRIKER_X) // 2]
+        shots = []
+        for _ in range(count):
+            shots.append((
+                generator.choice(positions),
+                generator.uniform(-math.pi + 0.15, -0.15),
+                generator.uniform(6, MAX_POWER)
+            ))
+        return shots
+
+    def search(self, coins, rules, board, stop_event):
+        shots = self.candidate_shots(coins, board)
+        for start in range(0, len(shots), BATCH_SIZE):
+
+            if stop_event.is_set() or self.expired():
+                break
+            batch = shots[start:start + BATCH_SIZE]
+            outcomes = [self.cache.get(board, shot) for shot in batch]
+            missing = [shot for shot, outcome in zip(batch, outcomes) if outcome is None]
+
+            if missing:
+                fresh = iter(self.simulate(coins, missing))
+                for k, shot in enumerate(batch):
+
+                    if outcomes[k] is None:
+                        outcomes[k] = next(fresh)
+                        self.cache.put(board, shot, outcomes[k])
+            for shot, outcome in zip(batch, outcomes):
+                score = score_outcome(coins, *outcome, rules)
+
+                with self.lock:
+
+                    if stop_event.is_set():
+                        return
+                    self.evaluated += 1
+
+                    if self.best_score is None or score > self.best_score:
+                        self.best = shot
+                        self.best_score = score
+
+        with self.lock:
+
+            if not stop_event.is_set():
+                self.done = True
+
+    def simulate(self, coins, shots):
+
+        if np is not None:
+            simulation = BatchSimulation()
+            simulation.reset(coins, [(x, STRIKER_Y) + shot_velocity(angle, power) for x, angle, power in shots])
+            simulation.run()
+            for board in range(len(shots)):
+                pocketed = [int(i) for i in np.flatnonzero(simulation.pocketed_at[board, :-1] >= 0)]
+                positions = [(coin['x'], coin['y']) for coin in simulation.coins(board)]
+                yield pocketed, bool(simulation.fouls[board]), positions
+            return
+        simulation = BoardSimulation()
+        for x, angle, power in shots:
+            simulation.reset(coins, x, STRIKER_Y)
+            simulation.strike(*shot_velocity(angle, power))
+            events = simulation.run_events()
+            pocketed = [event[1] for event in events if event[0] == 'coin_pocketed']
+            foul = any(event[0] == 'striker_pocketed' for event in events)
+            yield pocketed, foul, [(coin['x'], coin['y']) for coin in simulation.coins]
+
+    def result(self):
+
+        with self.lock:
+            return self.best
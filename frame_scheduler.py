@@ -0,0 +1,153 @@
+import itertools
+import math
+import time
+import traceback
+
+class FrameScheduler:
+
+    def __init__(self, root, frame_ms=16):
+        # One Tk after() drives every task. Tasks that fall due in the same
+        # frame run together, and an idle scheduler does not wake Tk at all.
+        self.root = root
+        self.frame_ms = frame_ms
+        self.tasks = {}
+        self.keys = {}
+        self.ids = itertools.count(1)
+        self.after_id = None
+        self.wake_time = None
+        self.last_frame = 0.0
+        self.paused = False
+        self.paused_at = None
+        self.frames = 0
+        self.overruns = 0
+        self.worst_frame_ms = 0.0
+
+    def after(self, delay_ms, callback, *args, key=None, pausable=False):
+        return self.add(delay_ms, None, callback, args, key, pausable)
+
+    def every(self, interval_ms, callback, *args, key=None, pausable=False):
+        return self.add(interval_ms, interval_ms, callback, args, key, pausable)
+
+    def add(self, delay_ms, interval_ms, callback, args, key, pausable):
+
+        if key is not None:
+            self.cancel(self.keys.get(key))
+        task_id = next(self.ids)
+        self.tasks[task_id] = {
+            'due': time.perf_counter() + delay_ms / 1000,
+            'interval': interval_ms,
+            'callback': callback,
+            'args': args,
+            'key': key,
+            'pausable': pausable
+        }
+
+        if key is not None:
+            self.keys[key] = task_id
+        self.wake()
+        return task_id
+
+    def coalesce(self, key, callback, *args):
+        # Input handlers call this on every event; only the newest arguments
+        # survive, and the callback runs once on the next frame.
+        task_id = self.keys.get(key)
+
+        if task_id is not None:
+            self.tasks[task_id]['args'] = args
+            return task_id
+        return self.after(0, callback, *args, key=key)
+
+    def flush(self, key, run=True):
+        task_id = self.keys.get(key)
+
+        if task_id is None:
+            return
+        task = self.tasks[task_id]
+        self.cancel(task_id)
+
+        if run:
+            task['callback'](*task['args'])
+
+    def cancel(self, task_id):
+        task = self.tasks.pop(task_id, None)
+
+        if task and task['key'] is not None and self.keys.get(task['key']) == task_id:
+            del self.keys[task['key']]
+
+    def pause(self):
+
+        if not self.paused:
+            self.paused = True
+            self.paused_at = time.perf_counter()
+
+    def resume(self):
+
+        if not self.paused:
+            return
+        paused_for = time.perf_counter() - self.paused_at
+        for task in self.tasks.values():
+
+            if task['pausable']:
+                task['due'] += paused_for
+        self.paused = False
+        self.paused_at = None
+        self.wake()
+
+    def runnable(self, task):
+        return not (self.paused and task['pausable'])
+
+    def wake(self):
+        due = [task['due'] for task in self.tasks.values() if self.runnable(task)]
+
+        if not due:
+            return
+        now = time.perf_counter()
+        wake_time = max(min(due), self.last_frame + self.frame_ms / 1000)
+
+        if self.after_id is not None:
+
+            if self.wake_time <= wake_time:
+                return
+            self.root.after_cancel(self.after_id)
+        self.wake_time = wake_time
+        self.after_id = self.root.after(max(1, math.ceil((wake_time - now) * 1000)), self.tick)
+
+    def tick(self):
+        self.after_id = None
+        started = time.perf_counter()
+        self.last_frame = started
+        self.frames += 1
+        for task_id, task in list(self.tasks.items()):
+
+            if task_id not in self.tasks or task['due'] > started or not self.runnable(task):
+                continue
+
+            if task['interval'] is None:
+                self.cancel(task_id)
+            else:
+                task['due'] = max(task['due'] + task['interval'] / 1000, started)
+
+            try:
+                result = task['callback'](*task['args'])
+
+            except Exception:
+                traceback.print_exc()
+                result = None
+
+            if result is False:
+                self.cancel(task_id)
+        frame_ms = (time.perf_counter() - started) * 1000
+        self.worst_frame_ms = max(self.worst_frame_ms, frame_ms)
+
+        if frame_ms > self.frame_ms:
+            self.overruns += 1
+        self.wake()
+
+    def stats(self):
+        return {
+            'frames': self.frames,
+            'overruns': self.overruns,
+            'worst_frame_ms': self.worst_frame_ms,
+            'tasks': len(self.tasks),
+            'paused': self.paused
+        }
@@ -0,0 +1,193 @@
+import argparse
+import json
+import math
+import os
+import sys
+
+from benchmark import SHOTS, scenarios
+from physics import BatchSimulation, BoardSimulation, STRIKER_Y, np
+from shot_evaluator import shot_velocity
+
+GOLDEN_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "golden_trajectories.json")
+GOLDEN_SCENARIOS = ['opening_0', 'opening_90', 'midgame_scatter', 'crowded_centre', 'late_game']
+GOLDEN_SHOTS = [0, 2, 5, 7]
+# Faster engines are accepted only inside these bounds: pixel drift from the
+# recorded path while stepping, and at rest, and how many ticks the shot may
+# run longer or shorter. What got pocketed must match exactly.
+TOLERANCES = {
+    'tick_drift': 0.5,
+    'final_drift': 1.0,
+    'ticks': 2
+}
+# The batch engine solves each impact from where the bodies are now instead
+# of timing it from the start of the tick as CoinTable does, so it rounds
+# differently: it must pocket the same coins on the same tick and come to
+# rest within a micropixel of the recorded path, which is itself rounded to
+# six decimals.
+ENGINE_TOLERANCES = {
+    'batch': {'final_drift': 1e-6, 'ticks': 0}
+}
+
+def snapshot(simulation):
+    bodies = simulation.coins + [simulation.striker]
+    return [[round(body['x'], 6), round(body['y'], 6)] for body in bodies]
+
+def outcome(simulation, events):
+    return {
+        'ticks': simulation.ticks,
+        'pocketed': sorted(event[1] for event in events if event[0] == 'coin_pocketed'),
+        'foul': any(event[0] == 'striker_pocketed' for event in events),
+        'final': snapshot(simulation)
+    }
+
+def record(path=GOLDEN_FILE):
+    boards = scenarios()
+    shots = []
+    for name in GOLDEN_SCENARIOS:
+        for index in GOLDEN_SHOTS:
+            striker_x, angle, power = SHOTS[index]
+            simulation = BoardSimulation(vectorized=False)
+            simulation.reset(boards[name], striker_x, STRIKER_Y)
+            simulation.strike(*shot_velocity(angle, power))
+            trajectory = []
+            events = []
+
+            while simulation.running:
+                events.extend(simulation.step())
+                trajectory.append(snapshot(simulation))
+            shots.append({
+                'scenario': name,
+                'coins': boards[name],
+                'shot': [striker_x, angle, power],
+                'trajectory': trajectory,
+                'outcome': outcome(simulation, events)
+            })
+
+    with open(path, 'w') as f:
+        json.dump({'tolerances': TOLERANCES, 'shots': shots}, f, separators=(',', ':'))
+    return shots
+
+def drift(first, second):
+    return max(math.hypot(a[0] - b[0], a[1] - b[1]) for a, b in zip(first, second))
+
+def replay_stepped(simulation, golden):
+    # Compares every tick; engines that stop early or run long are compared
+    # against the last state the other side reached.
+    striker_x, angle, power = golden['shot']
+    simulation.reset(golden['coins'], striker_x, STRIKER_Y)
+    simulation.strike(*shot_velocity(angle, power))
+    trajectory = golden['trajectory']
+    events = []
+    worst = 0.0
+    tick = 0
+
+    while simulation.running or tick < len(trajectory):
+
+        if simulation.running:
+            events.extend(simulation.step())
+        expected = trajectory[min(tick, len(trajectory) - 1)]
+        worst = max(worst, drift(snapshot(simulation), expected))
+        tick += 1
+    return outcome(simulation, events), worst
+
+def replay_final(run, golden):
+    striker_x, angle, power = golden['shot']
+    return run(golden['coins'], striker_x, STRIKER_Y, *shot_velocity(angle, power)), None
+
+def run_events(coins, striker_x, striker_y, vx, vy):
+    simulation = BoardSimulation()
+    simulation.reset(coins, striker_x, striker_y)
+    simulation.strike(vx, vy)
+    events = simulation.run_events()
+    return outcome(simulation, events)
+
+def run_batch(coins, striker_x, striker_y, vx, vy):
+    simulation = BatchSimulation()
+    simulation.reset(coins, [(striker_x, striker_y, vx, vy)])
+    simulation.run()
+    bodies = simulation.coins(0) + [{'x': simulation.state[0, -1, 0], 'y': simulation.state[0, -1, 1]}]
+    return {
+        'ticks': int(simulation.ticks[0]),
+        'pocketed': [int(i) for i in np.flatnonzero(simulation.pocketed_at[0, :-1] >= 0)],
+        'foul': bool(simulation.fouls[0]),
+        'final': [[float(body['x']), float(body['y'])] for body in bodies]
+    }
+
+def engines():
+    available = {
+        'python': lambda golden: replay_stepped(BoardSimulation(vectorized=False), golden),
+        'events': lambda golden: replay_final(run_events, golden)
+    }
+
+    if np is not None:
+        available['numpy'] = lambda golden: replay_stepped(BoardSimulation(vectorized=True), golden)
+        available['batch'] = lambda golden: replay_final(run_batch, golden)
+    return available
+
+def compare(golden, result, worst, tolerances):
+    expected = golden['outcome']
+    problems = []
+
+    if result['pocketed'] != expected['pocketed']:
+        problems.append(f"pocketed {result['pocketed']} != {expected['pocketed']}")
+
+    if result['foul'] != expected['foul']:
+        problems.append(f"foul {result['foul']} != {expected['foul']}")
+
+    if abs(result['ticks'] - expected['ticks']) > tolerances['ticks']:
+        problems.append(f"ticks {result['ticks']} != {expected['ticks']}")
+    final = drift(result['final'], expected['final'])
+
+    if final > tolerances['final_drift']:
+        problems.append(f"final drift {final:.4f}px")
+
+    if worst is not None and worst > tolerances['tick_drift']:
+        problems.append(f"tick drift {worst:.4f}px")
+    return final, problems
+
+def check(names=None, path=GOLDEN_FILE, verbose=False):
+
+    with open(path) as f:
+        recorded = json.load(f)
+    tolerances = recorded['tolerances']
+    available = engines()
+    failures = 0
+    for name in names or available:
+        replay = available[name]
+        limits = dict(tolerances, **ENGINE_TOLERANCES.get(name, {}))
+        worst_final = 0.0
+        worst_tick = 0.0
+        failed = 0
+        for golden in recorded['shots']:
+            result, worst = replay(golden)
+            final, problems = compare(golden, result, worst, limits)
+            worst_final = max(worst_final, final)
+            worst_tick = max(worst_tick, worst or 0.0)
+
+            if problems:
+                failed += 1
+
+                if verbose:
+                    print(f"  {name} {golden['scenario']} {golden['shot']}: {'; '.join(problems)}")
+        status = "ok" if not failed else f"{failed} FAILED"
+        print(f"{name:8} {len(recorded['shots'])} shots  max tick drift {worst_tick:.2e}px  "
+              f"max final drift {worst_final:.2e}px  {status}")
+        failures += failed
+    return failures
+
+def main():
+    parser = argparse.ArgumentParser(description="Record or check golden physics trajectories.")
+    parser.add_argument('command', choices=['record', 'check'])
+    parser.add_argument('--engine', action='append', help="engines to check (default: all available)")
+    parser.add_argument('--file', default=GOLDEN_FILE)
+    parser.add_argument('--verbose', action='store_true')
+    args = parser.parse_args()
+
+    if args.command == 'record':
+        shots = record(args.file)
+        print(f"Recorded {len(shots)} shots to {args.file}")
+        return
+    sys.exit(1 if check(args.engine, args.file, args.verbose) else 0)
+
+if __name__ == "__main__":
+    main()
@@ -9,6 +9,15 @@ from PIL import Image, ImageTk
 import math
 import pygame
 import json
+from physics import BoardSimulation
+from physics_worker import PhysicsWorker
+from coin import Coin, CoinSet
+from placement import CentrePlacement, StrikerBaseline
+from canvas_renderer import CanvasRegistry, OverlayLayer, RetainedRenderer
+from sprite_cache import SpriteCache
+from frame_scheduler import FrameScheduler
+from computer_player import ComputerPlayer, DIFFICULTY_LEVELS
+from shot_evaluator import shot_velocity
 
 if sys.platform == "win32":
     ctypes.windll.shell32.SetCurrentProcessExplicitAppUserModelID("com.jeet.CarromGame")
@@ -34,6 +43,7 @@ class CarromGame:
         self.root.geometry("650x760")
         self.root.configure(bg="#393939")
         self.root.resizable(False, False)
+        self.scheduler = FrameScheduler(root)
         self.data_dir = os.path.join(os.path.expanduser("~"), ".CarromGame")
         os.makedirs(self.data_dir, exist_ok=True)
 
@@ -55,10 +65,22 @@ class CarromGame:
         self.CENTER_X = self.BOARD_SIZE // 2
         self.CENTER_Y = self.BOARD_SIZE // 2
         self.BOUNDARY_MARGIN = self.STRIKER_RADIUS + 29
+        self.striker_baseline = StrikerBaseline(
+            self.STRIKER_Y,
+            self.STRIKER_RADIUS,
+            self.STRIKER_RADIUS + 126,
+            self.BOARD_SIZE - self.STRIKER_RADIUS - 127
+        )
+        self.centre_placement = CentrePlacement(self.CENTER_X, self.CENTER_Y)
+        self.PHYSICS_TICK = 0.02
+        self.MAX_CATCH_UP_TICKS = 5
+        self.FRAME_MS = 16
         self.striker_id = None
+        self.physics_worker = None
         self.current_player = 0
         self.slider_drag_offset = 0
         self.aim_line = None
+        self.aim_dots_shown = 0
         self.drag_start = None
         self.win_animation_running = False
         self.rubbing_channel = None
@@ -74,8 +96,7 @@ class CarromGame:
         self.board_rotated = False
         self.striker_velocity = [0, 0]
         self.friction = 0.96
-        self.coins = []
-        self.arc = None
+        self.coins = CoinSet()
         self.update_angle = 0
         self.animation_running = True
         self.timer_active = False
@@ -114,6 +135,18 @@ class CarromGame:
             (self.BOARD_SIZE - 52, self.BOARD_SIZE - 52)
         ]
         self.POCKET_RADIUS = 12
+        self.simulation = BoardSimulation(
+            board_size=self.BOARD_SIZE,
+            coin_radius=self.COIN_RADIUS,
+            striker_radius=self.STRIKER_RADIUS,
+            boundary_margin=self.BOUNDARY_MARGIN,
+            pocket_positions=self.pocket_positions,
+            pocket_radius=self.POCKET_RADIUS,
+            friction=self.friction
+        )
+        self.shot_coins = []
+        self.computer_player = None
+        self.computer_poll_id = None
         pygame.mixer.init()
         self.rubbing_sound = pygame.mixer.Sound(resource_path(r"assets\sounds\dragging.wav"))
         self.coin_collision_sounds = [
@@ -148,10 +181,10 @@ class CarromGame:
         self.select_game_mode_bg_label= tk.Label(root, image=self.select_game_mode_bg_photo,bg='#393939')
         self.select_game_mode_bg_label.place(x=0, y=0, relwidth=1, relheight=1)
         self.main_frame1 = tk.Frame(root, bg="#393939")
-        self.main_frame1.place(relx=0.5,rely=0.5,anchor='center', width=300, height=150)
+        self.main_frame1.place(relx=0.5,rely=0.5,anchor='center', width=300, height=200)
         self.main_frame2 = tk.Frame(root, bg="#393939")
         self.game_mode_frame = tk.Frame(self.main_frame1, bg="#393939")
-        self.game_mode_frame.place(relx=0.5, rely=0.5, anchor="center", width=300, height=150)
+        self.game_mode_frame.place(relx=0.5, rely=0.5, anchor="center", width=300, height=200)
         self.top_frame = tk.Frame(self.main_frame2, bg="#393939", height=60)
         self.canvas_frame = tk.Frame(self.main_frame2, bg="#393939")
         self.bottom_frame = tk.Frame(self.main_frame2, bg="#393939")
@@ -172,7 +205,7 @@ class CarromGame:
         self.new_game_btn = tk.Button(
             self.game_mode_frame,
             text="New Game",
-            command=self.start_new_game_with_rotation,
+            command=self.start_two_player_game,
             width=15,
             bg="#0BF113",
             fg="black",
@@ -195,6 +228,25 @@ class CarromGame:
             font=("Arial", 10, "bold")
         )
         continue_btn.pack(pady=5)
+        computer_frame = tk.Frame(self.game_mode_frame, bg="#393939")
+        computer_frame.pack(pady=5)
+        tk.Button(
+            computer_frame,
+            text="Play vs Computer",
+            command=self.start_computer_game,
+            width=15,
+            bg="#F8A10A",
+            fg="black",
+            activebackground="#F2C542",
+            activeforeground="black",
+            border=0,
+            font=("Arial", 10, "bold")
+        ).pack(side='left', padx=(0, 5))
+        self.computer_difficulty = tk.StringVar(self.root, value='Medium')
+        difficulty_menu = tk.OptionMenu(computer_frame, self.computer_difficulty, *DIFFICULTY_LEVELS)
+        difficulty_menu.config(bg="#393939", fg="white", activebackground="#393939", activeforeground="white",
+                               highlightthickness=0, border=0, font=("Arial", 9))
+        difficulty_menu.pack(side='left')
 
         if not os.path.exists(self.saved_game_file):
             continue_btn.config(state=tk.DISABLED)
@@ -246,12 +298,21 @@ class CarromGame:
         self.player_label2.place(x=30, y=30, anchor="center")
         self.canvas = tk.Canvas(self.canvas_frame, width=self.BOARD_SIZE, height=self.BOARD_SIZE, highlightthickness=0)
         self.canvas.pack(side="top", pady=(5, 0))
+        self.canvas_items = CanvasRegistry(self.canvas, strict=__debug__)
+        self.renderer = RetainedRenderer(self.canvas_items, self.request_render)
+        self.overlay = OverlayLayer(self.renderer, self.scheduler, (self.BOARD_SIZE, self.BOARD_SIZE))
         striker_img_size = int(2 * self.STRIKER_RADIUS * self.STRIKER_SCALE)
-        striker_img = Image.open(resource_path(r"assets\images\striker.png")).resize((striker_img_size, striker_img_size), Image.Resampling.LANCZOS)
-        self.striker_photo = ImageTk.PhotoImage(striker_img)
-        self.white_coin_img = ImageTk.PhotoImage(Image.open(resource_path(r"assets\images\white_coin.png")).resize((self.coin_size, self.coin_size), Image.Resampling.LANCZOS))
-        self.black_coin_img = ImageTk.PhotoImage(Image.open(resource_path(r"assets\images\black_coin.png")).resize((self.coin_size, self.coin_size), Image.Resampling.LANCZOS))
-        self.red_coin_img = ImageTk.PhotoImage(Image.open(resource_path(r"assets\images\queen.png")).resize((self.coin_size, self.coin_size), Image.Resampling.LANCZOS))
+        self.sprites = SpriteCache()
+        self.striker_photo = self.sprites.add_sprite('striker', Image.open(resource_path(r"assets\images\striker.png")), striker_img_size)
+        self.white_coin_img = self.sprites.add_sprite('white', Image.open(resource_path(r"assets\images\white_coin.png")), self.coin_size)
+        self.black_coin_img = self.sprites.add_sprite('black', Image.open(resource_path(r"assets\images\black_coin.png")), self.coin_size)
+        self.red_coin_img = self.sprites.add_sprite('red', Image.open(resource_path(r"assets\images\queen.png")), self.coin_size)
+        self.sprites.add_banner('foul', "FOUL", 70, "#FF0000")
+        for winner in ("PLAYER 1", "PLAYER 2"):
+            self.sprites.add_banner(f"win {winner}", f"CONGRATULATIONS\n{winner} WINNN...!", 45, "#0905F8")
+        self.sprites.add_banner('queen', "QUEEN COVERED", 45, "#0905F8", steps=1)
+        self.sprites.add_shade('black', '#000000', (self.BOARD_SIZE, self.BOARD_SIZE), 0.85)
+        self.sprites.add_shade('green', '#00FF00', (self.BOARD_SIZE, self.BOARD_SIZE), 0.85, peaks=(0.7,))
         white_red_coin_frame1 = tk.Frame(player1_frame, bg="#393939")
         white_red_coin_frame1.pack()
         white_coin_frame = tk.Frame(white_red_coin_frame1, bg="#393939")
@@ -290,6 +351,7 @@ class CarromGame:
 
     def pause_game(self):
         self.paused = True
+        self.scheduler.pause()
         self.start_pause_button.config(text="▶")
         self.stop_turn_timer()
         self.animation_running = False
@@ -321,6 +383,7 @@ class CarromGame:
 
     def resume_game(self):
         self.paused = False
+        self.scheduler.resume()
         self.start_pause_button.config(text="||")
 
         if self.pause_frame:
@@ -333,23 +396,37 @@ class CarromGame:
             self.start_turn_timer()
 
     def return_to_main_menu(self):
+        self.stop_computer_turn()
+        self.scheduler.resume()
         self.save_game_state()
+        self.clear_canvas()
+        self.coins.clear()
 
         if self.pause_frame:
             self.pause_frame.destroy()
             self.pause_frame = None
         self.main_frame2.pack_forget()
-        self.main_frame1.place(relx=0.5, rely=0.5, anchor='center', width=300, height=150)
+        self.main_frame1.place(relx=0.5, rely=0.5, anchor='center', width=300, height=200)
         self.paused = False
         self.start_pause_button.config(text="||")
 
+    def start_two_player_game(self):
+        self.stop_computer_turn()
+        self.computer_player = None
+        self.start_new_game_with_rotation()
+
+    def start_computer_game(self):
+        self.stop_computer_turn()
+        self.computer_player = ComputerPlayer(self.computer_difficulty.get())
+        self.start_new_game_with_rotation()
+
     def start_new_game_with_rotation(self):
         self.main_frame1.place_forget()
         self.main_frame2.pack(fill='both',expand=True)
         self.top_frame.pack(side="top", fill='x', pady=(10, 0))
         self.canvas_frame.pack(side="top")
         self.bottom_frame.pack(side="top", fill='x', pady=(0, 10))
-        self.root.after(10, self.initialize_game)
+        self.scheduler.after(10, self.initialize_game)
 
     def initialize_game(self):
         self.timer_active = False
@@ -358,9 +435,9 @@ class CarromGame:
         self.place_coins()
         self.original_coin_positions = []
         for coin in self.coins:
-            self.original_coin_positions.append((coin['x'], coin['y']))
+            self.original_coin_positions.append((coin.x, coin.y))
         self.create_rotation_slider()
-        self.root.after(200, self.update_scores_periodic)
+        self.scheduler.after(200, self.update_scores_periodic)
         self.rotation_active = True
 
     def load_saved_game(self):
@@ -390,28 +467,20 @@ class CarromGame:
                 self.current_player = 1 - self.current_player
             self.create_board()
             self.create_slider()
-            self.root.after(200, self.update_scores_periodic)
-            self.coins = []
+            self.scheduler.after(200, self.update_scores_periodic)
+            self.coins.clear()
             for coin_data in saved_data.get('coins', []):
                 coin_type = coin_data['type']
                 img = self.white_coin_img if coin_type == 'white' else \
                       self.black_coin_img if coin_type == 'black' else \
                       self.red_coin_img
-                coin_id = self.canvas.create_image(
+                coin_id = self.canvas_items.create(
+                    'coins', 'image',
                     coin_data['x'],
                     coin_data['y'],
                     image=img
                 )
-                self.coins.append({
-                    'id': coin_id,
-                    'x': coin_data['x'],
-                    'y': coin_data['y'],
-                    'radius': self.COIN_RADIUS,
-                    'vx': 0.0,
-                    'vy': 0.0,
-                    'moving': False,
-                    'type': coin_type
-                })
+                self.coins.append(Coin(coin_id, coin_data['x'], coin_data['y'], coin_type, self.COIN_RADIUS))
             slider_knob_x = saved_data.get('slider_knob_x', 165)
             self.slider_canvas.coords(self.slider_knob, slider_knob_x, 17)
 
@@ -423,7 +492,7 @@ class CarromGame:
             striker_x = min_board_x + slider_ratio * (max_board_x - min_board_x)
             self.draw_striker(striker_x, self.STRIKER_Y)
             self.rotate_arc()
-            self.root.after(1000, self.start_turn_timer)
+            self.scheduler.after(1000, self.start_turn_timer)
 
         except Exception as e:
             print(f"Error loading saved game: {e}")
@@ -437,18 +506,14 @@ class CarromGame:
             'slider_knob_x': 165,
             'player1_queen_covered': self.player1_queen_covered,
             'player2_queen_covered': self.player2_queen_covered,
-            'turn_incomplete': self.striker_moving or any(c['moving'] for c in self.coins)
+            'turn_incomplete': self.striker_moving or self.coins.any_moving()
         }
 
         if hasattr(self, 'slider_knob') and self.slider_knob:
             knob_x = self.slider_canvas.coords(self.slider_knob)[0]
             game_state['slider_knob_x'] = knob_x
         for coin in self.coins:
-            game_state['coins'].append({
-                'x': coin['x'],
-                'y': coin['y'],
-                'type': coin['type']
-            })
+            game_state['coins'].append(coin.to_dict())
 
         try:
 
@@ -559,12 +624,33 @@ class CarromGame:
         self.player2_score_label = tk.Label(player2_frame,text= "0",font=('arial, 15'),fg='white', bg='#393939')
         self.player2_score_label.pack(padx=5)
 
+    def request_render(self):
+        self.scheduler.after(0, self.renderer.flush, key='render')
+
+    def clear_canvas(self):
+
+        if self.physics_worker:
+            self.physics_worker.stop()
+        for key in ('slider', 'aim', 'rotation'):
+            self.scheduler.flush(key, run=False)
+        self.overlay.cancel()
+        self.renderer.clear()
+        self.canvas_items.clear()
+        self.canvas_items.check_growth()
+        self.striker_id = None
+        self.aim_dots_shown = 0
+        self.aim_line = None
+        self.drag_start = None
+        self.striker_moving = False
+
     def create_board(self):
-        self.canvas.create_image(0, 0, anchor=tk.NW, image=self.bg_photo)
+        self.clear_canvas()
+        self.canvas_items.create('board', 'image', 0, 0, anchor=tk.NW, image=self.bg_photo)
         pocket_radius = self.POCKET_RADIUS
         offset = 50
         for x, y in self.pocket_positions:
-            self.canvas.create_arc(
+            self.canvas_items.create(
+                'board', 'arc',
                 x - pocket_radius, y - pocket_radius,
                 x + pocket_radius, y + pocket_radius,
                 start=0, extent=359.9,
@@ -582,7 +668,7 @@ class CarromGame:
             length=250,
             orient=tk.HORIZONTAL,
             label="Rotate Coins",
-            command=self.rotate_coins,
+            command=self.on_rotation_slide,
             background="#393939",
             troughcolor="#5757AA",
             highlightthickness=0,
@@ -621,39 +707,44 @@ class CarromGame:
         cancel_rotation_btn.pack(side='left', padx=30)
 
     def apply_rotation(self):
+        self.scheduler.flush('rotation')
         self.scale_frame.pack_forget()
         self.update_striker(self.CENTER_X)
         self.rotate_arc()
         self.create_slider()
         self.rotation_active = False
-        self.root.after(1000, self.start_turn_timer)
+        self.scheduler.after(1000, self.start_turn_timer)
 
     def cancel_rotation(self):
         self.rotation_slider.set(0)
+        self.scheduler.flush('rotation', run=False)
         for i, coin in enumerate(self.coins):
 
-            if not coin.get('pocketed'):
+            if not coin.pocketed:
                 orig_x, orig_y = self.original_coin_positions[i]
-                coin['x'] = orig_x
-                coin['y'] = orig_y
-                self.canvas.coords(coin['id'], orig_x, orig_y)
+                coin.x = orig_x
+                coin.y = orig_y
+                self.canvas.coords(coin.id, orig_x, orig_y)
         self.scale_frame.pack_forget()
         self.update_striker(self.CENTER_X)
         self.rotate_arc()
         self.create_slider()
         self.rotation_active = False
-        self.root.after(1000, self.start_turn_timer)
+        self.scheduler.after(1000, self.start_turn_timer)
+
+    def on_rotation_slide(self, angle_str):
+        self.scheduler.coalesce('rotation', self.rotate_coins, angle_str)
 
     def rotate_coins(self, angle_str):
 
-        if self.striker_moving or any(coin['moving'] for coin in self.coins):
+        if self.striker_moving or self.coins.any_moving():
             return
         angle = float(angle_str)
         angle_rad = math.radians(angle)
         red_queen = None
         for coin in self.coins:
 
-            if coin['type'] == 'red' and not coin.get('pocketed'):
+            if coin.type == 'red' and not coin.pocketed:
                 red_queen = coin
                 break
 
@@ -663,36 +754,25 @@ class CarromGame:
         sin_a = math.sin(angle_rad)
         for coin in self.coins:
 
-            if coin.get('pocketed') or coin['type'] == 'red':
+            if coin.pocketed or coin.type == 'red':
                 continue
-            dx = coin['initial_dx']
-            dy = coin['initial_dy']
+            dx = coin.initial_dx
+            dy = coin.initial_dy
             rot_x = dx * cos_a - dy * sin_a
             rot_y = dx * sin_a + dy * cos_a
-            new_x = red_queen['x'] + rot_x
-            new_y = red_queen['y'] + rot_y
-            coin['x'] = new_x
-            coin['y'] = new_y
-            self.canvas.coords(coin['id'], new_x, new_y)
+            new_x = red_queen.x + rot_x
+            new_y = red_queen.y + rot_y
+            coin.x = new_x
+            coin.y = new_y
+            self.canvas.coords(coin.id, new_x, new_y)
 
     def place_coins(self):
-        self.coins = []
+        self.coins.clear()
         self.relative_coin_positions = []
         spacing = self.COIN_RADIUS * 2 + 2
         base_angle_deg = 30
-        red_coin_id = self.canvas.create_image(self.CENTER_X, self.CENTER_Y, image=self.red_coin_img)
-        self.coins.append({
-            'id': red_coin_id,
-            'x': self.CENTER_X,
-            'y': self.CENTER_Y,
-            'radius': self.COIN_RADIUS,
-            'vx': 0.0,
-            'vy': 0.0,
-            'moving': False,
-            'type': 'red',
-            'initial_dx': 0,
-            'initial_dy': 0
-        })
+        red_coin_id = self.canvas_items.create('coins', 'image', self.CENTER_X, self.CENTER_Y, image=self.red_coin_img)
+        self.coins.append(Coin(red_coin_id, self.CENTER_X, self.CENTER_Y, 'red', self.COIN_RADIUS))
         directions = []
         for i in range(6):
             angle_deg = base_angle_deg + i * 60
@@ -717,19 +797,8 @@ class CarromGame:
             y = self.CENTER_Y + rel_y
             color = 'white' if i % 2 == 0 else 'black'
             img = self.white_coin_img if color == 'white' else self.black_coin_img
-            coin_id = self.canvas.create_image(x, y, image=img)
-            self.coins.append({
-                'id': coin_id,
-                'x': x,
-                'y': y,
-                'radius': self.COIN_RADIUS,
-                'vx': 0.0,
-                'vy': 0.0,
-                'moving': False,
-                'type': color,
-                'initial_dx': rel_x,
-                'initial_dy': rel_y
-            })
+            coin_id = self.canvas_items.create('coins', 'image', x, y, image=img)
+            self.coins.append(Coin(coin_id, x, y, color, self.COIN_RADIUS, initial_dx=rel_x, initial_dy=rel_y))
 
     def create_slider(self):
         track_img = Image.open(resource_path(r"assets\images\slider_bar.png")).resize((330, 35), Image.Resampling.LANCZOS)
@@ -750,15 +819,16 @@ class CarromGame:
             self.stop_slider_drag_sound()
             self.drag_sound_timeout = None
         else:
-            self.drag_sound_timeout = self.root.after(100, self.check_drag_inactivity)
+            self.drag_sound_timeout = self.scheduler.after(100, self.check_drag_inactivity)
 
     def on_slider_release(self, event):
+        self.scheduler.flush('slider')
         self.stop_slider_drag_sound()
         self.last_drag_time = 0
 
     def start_slider_drag(self, event):
 
-        if self.timeout_in_progress or self.rotation_active or self.paused:
+        if self.timeout_in_progress or self.rotation_active or self.paused or self.is_computer_turn():
             self.slider_drag_offset = 0
             return
         self.slider_drag_offset = event.x - self.slider_canvas.coords(self.slider_knob)[0]
@@ -771,12 +841,15 @@ class CarromGame:
         self.last_drag_time = time.time()
 
         if not self.drag_sound_timeout:
-            self.drag_sound_timeout = self.root.after(100, self.check_drag_inactivity)
+            self.drag_sound_timeout = self.scheduler.after(100, self.check_drag_inactivity)
 
         if not self.slider_drag_sound_playing:
             self.slider_drag_sound.play(-1)
             self.slider_drag_sound_playing = True
-        new_x = event.x - self.slider_drag_offset
+        self.scheduler.coalesce('slider', self.apply_slider_drag, event.x)
+
+    def apply_slider_drag(self, pointer_x):
+        new_x = pointer_x - self.slider_drag_offset
         new_x = max(18, min(new_x, 330 - 18))
         self.slider_canvas.coords(self.slider_knob, new_x, 17)
         min_board_x = self.STRIKER_RADIUS + 126
@@ -792,7 +865,7 @@ class CarromGame:
             self.slider_drag_sound_playing = False
 
         if self.drag_sound_timeout:
-            self.root.after_cancel(self.drag_sound_timeout)
+            self.scheduler.cancel(self.drag_sound_timeout)
             self.drag_sound_timeout = None
 
     def update_striker(self, x):
@@ -800,7 +873,7 @@ class CarromGame:
         if self.timeout_in_progress:
             return
 
-        if self.striker_moving or any(c['moving'] for c in self.coins):
+        if self.striker_moving or self.coins.any_moving():
             return
         x = int(float(x))
         y = self.STRIKER_Y
@@ -809,116 +882,85 @@ class CarromGame:
         self.update_arc_position(safe_x)
 
     def find_safe_striker_position(self, target_x):
-        min_x = self.STRIKER_RADIUS + 126
-        max_x = self.BOARD_SIZE - self.STRIKER_RADIUS - 127
-
-        if not self.is_colliding_with_coins(target_x, self.STRIKER_Y):
-            return target_x
-        left_search = target_x
-        right_search = target_x
-        found_left = False
-        found_right = False
-
-        while (left_search >= min_x or right_search <= max_x) and not (found_left or found_right):
-
-            if left_search >= min_x:
-                left_search -= 1
-
-                if not self.is_colliding_with_coins(left_search, self.STRIKER_Y):
-                    found_left = True
-
-            if right_search <= max_x:
-                right_search += 1
-
-                if not self.is_colliding_with_coins(right_search, self.STRIKER_Y):
-                    found_right = True
-
-        if found_left and found_right:
-            left_dist = abs(target_x - left_search)
-            right_dist = abs(target_x - right_search)
-            return left_search if left_dist < right_dist else right_search
-        elif found_left:
-            return left_search
-        elif found_right:
-            return right_search
-        return target_x
-
-    def is_colliding_with_coins(self, x, y):
-        for coin in self.coins:
-
-            if coin.get('pocketed'):
-                continue
-            dx = x - coin['x']
-            dy = y - coin['y']
-            distance = math.hypot(dx, dy)
-
-            if distance < self.STRIKER_RADIUS + coin['radius']:
-                return True
-        return False
+        return self.striker_baseline.nearest_free(self.coins, target_x)
 
     def draw_striker(self, x, y):
 
         if self.striker_id:
-            self.canvas.delete(self.striker_id)
-        self.striker_id = self.canvas.create_image(x, y, image=self.striker_photo, anchor=tk.CENTER)
+            self.renderer.update('striker', coords=(x, y), image=self.striker_photo)
+            return
+        self.striker_id = self.renderer.create('striker', 'striker', 'image', x, y, image=self.striker_photo, anchor=tk.CENTER)
         self.canvas.tag_bind(self.striker_id, "<ButtonPress-1>", self.on_striker_press)
         self.canvas.tag_bind(self.striker_id, "<B1-Motion>", self.on_striker_drag)
         self.canvas.tag_bind(self.striker_id, "<ButtonRelease-1>", self.on_striker_release)
 
+        if 'arc' in self.renderer:
+            self.canvas.tag_raise(self.renderer.item('arc'), self.striker_id)
+
     def update_arc_position(self, x):
 
-        if self.arc:
-            self.canvas.delete(self.arc)
+        if not self.animation_running:
+            self.hide_arc()
+            return
+        arc_radius = self.STRIKER_RADIUS + 3
+        coords = (
+            x - arc_radius, self.STRIKER_Y - arc_radius,
+            x + arc_radius, self.STRIKER_Y + arc_radius
+        )
 
-        if self.animation_running:
-            arc_radius = self.STRIKER_RADIUS + 3
-            self.arc = self.canvas.create_arc(
-                x - arc_radius, self.STRIKER_Y - arc_radius,
-                x + arc_radius, self.STRIKER_Y + arc_radius,
+        if 'arc' in self.renderer:
+            self.renderer.show('arc', coords=coords, start=self.update_angle, outline=self.arc_color)
+        else:
+            self.renderer.create(
+                'arc', 'arc', 'arc', *coords,
                 start=self.update_angle, extent=250,
                 style=tk.ARC, outline=self.arc_color, width=6
             )
 
+    def hide_arc(self):
+
+        if 'arc' in self.renderer:
+            self.renderer.hide('arc')
+
     def rotate_arc(self):
 
         if self.animation_running:
             self.update_angle = (self.update_angle - 5) % 360
-            striker_x = self.canvas.coords(self.striker_id)[0] if self.striker_id else self.get_slider_value()
+            striker_x = self.item_coords(self.striker_id)[0] if self.striker_id else self.get_slider_value()
             self.update_arc_position(striker_x)
-            self.root.after(30, self.rotate_arc)
+            self.scheduler.after(30, self.rotate_arc, key='arc', pausable=True)
 
     def on_striker_press(self, event):
 
-        if self.timeout_in_progress or self.rotation_active or self.paused:
+        if self.timeout_in_progress or self.rotation_active or self.paused or self.is_computer_turn():
             return
 
-        if self.striker_moving or any(c['moving'] for c in self.coins):
+        if self.striker_moving or self.coins.any_moving():
             return
         self.drag_start = (event.x, event.y)
         self.update_arc_position(self.get_slider_value())
 
     def on_striker_drag(self, event):
 
-        if self.timeout_in_progress or self.rotation_active or self.paused:
+        if self.timeout_in_progress or self.rotation_active or self.paused or self.is_computer_turn():
             return
 
-        if self.striker_moving or any(c['moving'] for c in self.coins):
+        if self.striker_moving or self.coins.any_moving():
             return
+        self.scheduler.coalesce('aim', self.update_aim, event.x, event.y)
+
+    def update_aim(self, pointer_x, pointer_y):
 
         if self.arc_color != "#00ff33":
             self.arc_color = "#00ff33"
             self.update_arc_position(self.get_slider_value())
-        self.canvas.delete("aim_dot")
-
-        if self.drag_start:
-            coords = self.canvas.coords(self.striker_id)
 
-            if not coords:
-                return
+        if self.drag_start and self.striker_id:
+            coords = self.item_coords(self.striker_id)
             striker_x = coords[0]
             striker_y = coords[1]
-            dx = event.x - self.drag_start[0]
-            dy = event.y - self.drag_start[1]
+            dx = pointer_x - self.drag_start[0]
+            dy = pointer_y - self.drag_start[1]
             scale_factor = 2.0
             aim_dx = -dx * scale_factor
             aim_dy = -dy * scale_factor
@@ -937,16 +979,34 @@ class CarromGame:
                 dot_x = striker_x + math.cos(angle) * d
                 dot_y = striker_y + math.sin(angle) * d
                 radius = max(2, 6 * (0.8 - t))
-                self.canvas.create_oval(
+                self.draw_aim_dot(i, (
                     dot_x - radius, dot_y - radius,
-                    dot_x + radius, dot_y + radius,
-                    fill="white", outline="", tags="aim_dot"
-                )
+                    dot_x + radius, dot_y + radius
+                ))
+            self.hide_aim_dots(num_dots)
             self.aim_line = "aim_dot"
+        else:
+            self.hide_aim_dots()
+
+    def draw_aim_dot(self, index, coords):
+        # Dots are pooled: the longest aim line so far decides how many ovals
+        # exist, and shorter lines hide the ones they do not use.
+        name = f"aim_dot_{index}"
+
+        if name in self.renderer:
+            self.renderer.show(name, coords=coords)
+        else:
+            self.renderer.create(name, 'aim', 'oval', *coords, fill="white", outline="", tags="aim_dot")
+
+    def hide_aim_dots(self, keep=0):
+        for i in range(keep, self.aim_dots_shown):
+            self.renderer.hide(f"aim_dot_{i}")
+        self.aim_dots_shown = keep
 
     def on_striker_release(self, event):
+        self.scheduler.flush('aim')
 
-        if self.timeout_in_progress or self.rotation_active:
+        if self.timeout_in_progress or self.rotation_active or self.is_computer_turn():
             return
 
         if self.drag_start and self.aim_line:
@@ -956,184 +1016,211 @@ class CarromGame:
             MIN_DRAG_DISTANCE = 20
 
             if distance < MIN_DRAG_DISTANCE:
-                self.canvas.delete("aim_dot")
+                self.hide_aim_dots()
                 self.aim_line = None
                 self.drag_start = None
                 self.arc_color = "#ff0000"  # Restore original arc color
                 self.update_arc_position(self.get_slider_value())
                 return
-            self.animation_running = False
-
-            if self.arc:
-                self.canvas.delete(self.arc)
-                self.arc = None
             speed = min(distance / 5, 35)
-            self.striker_velocity = [
-                -dx / distance * speed,
-                -dy / distance * speed
-            ]
-            self.canvas.delete("aim_dot")
+            self.hide_aim_dots()
             self.aim_line = None
             self.drag_start = None
-            self.striker_moving = True
-            self.slider_canvas.pack_forget()
-            self.move_objects()
+            self.shoot(-dx / distance * speed, -dy / distance * speed)
 
         if self.striker_moving:
             self.stop_turn_timer()
 
+    def shoot(self, vx, vy):
+        self.animation_running = False
+        self.hide_arc()
+        self.striker_velocity = [vx, vy]
+        self.striker_moving = True
+        self.slider_canvas.pack_forget()
+        self.start_simulation()
+        self.move_objects()
+
+    def is_computer_turn(self):
+        return self.computer_player is not None and self.current_player == 1
+
+    def start_computer_turn(self):
+
+        if self.computer_poll_id or self.striker_moving:
+            return
+        coins = [{'x': c.x, 'y': c.y, 'radius': c.radius, 'type': c.type}
+                 for c in self.coins if not c.pocketed]
+        rules = {
+            'color': self.player_coin_colors[self.current_player],
+            'score': self.player1_score if self.current_player == 0 else self.player2_score,
+            'queen_pocketed_last_turn': self.queen_pocketed_last_turn,
+            'player': self.current_player,
+            'queen_covered': (self.player1_queen_covered, self.player2_queen_covered)
+        }
+        self.computer_player.start(coins, rules)
+        self.computer_poll_id = self.scheduler.after(50, self.poll_computer_turn, pausable=True)
+
+    def poll_computer_turn(self):
+        self.computer_poll_id = None
+
+        if not self.is_computer_turn() or self.timeout_in_progress:
+            self.stop_computer_turn()
+            return
+
+        if self.paused or not (self.computer_player.done or self.computer_player.expired()):
+            self.computer_poll_id = self.scheduler.after(50, self.poll_computer_turn, pausable=True)
+            return
+        shot = self.computer_player.result() or (self.get_slider_value(), -math.pi / 2, 20)
+        self.take_computer_shot(*shot)
+
+    def take_computer_shot(self, striker_x, angle, power):
+        min_board_x = self.STRIKER_RADIUS + 126
+        max_board_x = self.BOARD_SIZE - self.STRIKER_RADIUS - 127
+        knob_x = 18 + (striker_x - min_board_x) / (max_board_x - min_board_x) * (330 - 36)
+        self.slider_canvas.coords(self.slider_knob, knob_x, 17)
+        self.update_striker(striker_x)
+        self.shoot(*shot_velocity(angle, power))
+        self.stop_turn_timer()
+
+    def stop_computer_turn(self):
+
+        if self.computer_poll_id:
+            self.scheduler.cancel(self.computer_poll_id)
+            self.computer_poll_id = None
+
+        if self.computer_player:
+            self.computer_player.cancel()
+
     def play_coin_pocket_sound(self):
         sound = random.choice(self.coin_pocket_sounds)
         sound.set_volume(1.0)
         sound.play()
 
+    def start_simulation(self):
+        self.shot_coins = [c for c in self.coins if not c.pocketed]
+        striker_x, striker_y = self.item_coords(self.striker_id)
+        coins = [{'x': c.x, 'y': c.y, 'vx': c.vx, 'vy': c.vy, 'radius': c.radius, 'type': c.type}
+                 for c in self.shot_coins]
+        self.simulation.reset(coins, striker_x, striker_y)
+        self.simulation.strike(*self.striker_velocity)
+        self.drawn_positions = {}
+        self.physics_worker = PhysicsWorker(self.simulation, self.PHYSICS_TICK, self.MAX_CATCH_UP_TICKS)
+        self.physics_worker.start()
+
     def move_objects(self):
+        # Physics ticks on the worker thread; each frame only reads the two
+        # newest snapshots, draws between them and handles new events.
 
-        if self.striker_moving:
-            striker_coords = self.canvas.coords(self.striker_id)
+        if self.physics_worker.stopped:
+            return
+        # The worker appends a tick's events before its snapshot, so reading
+        # the snapshot first means every event up to it is already queued,
+        # including the final tick's when the shot has just ended.
+        snapshots = self.physics_worker.latest(2)
+        current = snapshots[-1]
+        events = self.physics_worker.drain_events()
+        striker_pocket = self.handle_physics_events(events)
+        for coin, (x, y, moving) in zip(self.shot_coins, current.bodies):
+
+            if not coin.pocketed:
+                coin.x = x
+                coin.y = y
+                coin.moving = moving
+
+        if striker_pocket:
+            self.render_objects(current, current, 1.0)
+            self.animate_into_pocket(self.striker_id, *striker_pocket, is_striker=True, sprite='striker')
+            return
 
-            if striker_coords:
-                striker_x, striker_y = striker_coords
-                for pocket_x, pocket_y in self.pocket_positions:
-                    distance = math.hypot(striker_x - pocket_x, striker_y - pocket_y)
+        if current.running:
+            alpha = min(1.0, (time.perf_counter() - current.time) / self.PHYSICS_TICK)
+            self.render_objects(snapshots[0], current, alpha)
+            self.scheduler.after(self.FRAME_MS, self.move_objects)
+            return
+        self.render_objects(current, current, 1.0)
 
-                    if distance < self.POCKET_RADIUS + self.STRIKER_RADIUS / 2:
-                        self.animate_into_pocket(self.striker_id, pocket_x, pocket_y, is_striker=True)
-                        return
-            striker_speed = math.sqrt(self.striker_velocity[0]**2 + self.striker_velocity[1]**2)
+        if self.rubbing_channel:
+            self.rubbing_channel.stop()
+            self.rubbing_channel = None
+        self.striker_moving = False
+        self.animation_running = True
+        self.arc_color = "#ff0000"
+        self.update_striker(self.get_slider_value())
+        self.rotate_arc()
+        self.slider_canvas.pack(pady=(5, 20))
 
-            if striker_speed < 80:
-                volume = max(0.05, min(1.0, striker_speed / 8))
-            else:
+        def remove_pocketed():
+            for coin in self.coins.remove_pocketed():
+                self.canvas_items.delete(coin.id)
+        self.scheduler.after(1, remove_pocketed)
+        self.update_scores_periodic()
+        self.scheduler.after(1, self.end_turn_reset)
+
+    def handle_physics_events(self, events):
+        striker_pocket = None
+        for event in events:
+            kind = event[0]
+
+            if kind == 'striker_pocketed':
+                striker_pocket = event[1:]
+            elif kind == 'coin_collision' and event[1] > 3:
+                self.play_coin_collision_sound(event[1])
+            elif kind == 'edge_collision' and event[1] > 3:
+                self.play_edge_collision_sound(event[1])
+            elif kind == 'coin_pocketed':
+                coin = self.shot_coins[event[1]]
+                self.on_coin_pocketed(coin, event[2], event[3])
+        return striker_pocket
+
+    def render_objects(self, previous, current, alpha):
+        items = [coin.id for coin in self.shot_coins] + [self.striker_id]
+        for item, coin, before, after in zip(items, self.shot_coins + [None], previous.bodies, current.bodies):
+
+            if coin is not None and coin.pocketed:
+                continue
+            position = (before[0] + (after[0] - before[0]) * alpha, before[1] + (after[1] - before[1]) * alpha)
 
-                if self.rubbing_channel and self.rubbing_channel.get_busy():
-                    self.rubbing_channel.stop()
-                    self.rubbing_channel = None
-            x, y = self.canvas.coords(self.striker_id)
-            vx, vy = self.striker_velocity
-            steps = int(max(abs(vx), abs(vy)) // 4) + 1
-            dx_step = vx / steps
-            dy_step = vy / steps
-            for i in range(steps):
-                temp_x = x + dx_step * (i + 1)
-                temp_y = y + dy_step * (i + 1)
-                self.check_collisions(temp_x, temp_y)
-            new_x = x + vx
-            new_y = y + vy
-            self.striker_velocity[0] *= self.friction
-            self.striker_velocity[1] *= self.friction
-            edge_collision = False
-
-            if new_x < self.BOUNDARY_MARGIN or new_x > self.BOARD_SIZE - self.BOUNDARY_MARGIN:
-                self.striker_velocity[0] = -self.striker_velocity[0] * 0.9
-                edge_collision = True
-
-            if new_y < self.BOUNDARY_MARGIN or new_y > self.BOARD_SIZE - self.BOUNDARY_MARGIN:
-                self.striker_velocity[1] = -self.striker_velocity[1] * 0.9
-                edge_collision = True
-
-            if edge_collision and striker_speed > 3:
-                self.play_edge_collision_sound(striker_speed)
-            new_x = max(self.BOUNDARY_MARGIN, min(new_x, self.BOARD_SIZE - self.BOUNDARY_MARGIN))
-            new_y = max(self.BOUNDARY_MARGIN, min(new_y, self.BOARD_SIZE - self.BOUNDARY_MARGIN))
-            self.canvas.coords(self.striker_id, new_x, new_y)
-        coins_moving = False
-        pocket_positions = self.pocket_positions
-        active_coins = [c for c in self.coins if not c.get('pocketed')]
-        for coin in active_coins:
-
-            if coin['moving']:
-                coin['x'] += coin['vx']
-                coin['y'] += coin['vy']
-                coin['vx'] *= self.friction
-                coin['vy'] *= self.friction
-                coin_speed = math.sqrt(coin['vx']**2 + coin['vy']**2)
-                edge_collision = False
-
-                if coin['x'] < self.BOUNDARY_MARGIN or coin['x'] > self.BOARD_SIZE - self.BOUNDARY_MARGIN:
-                    coin['vx'] = -coin['vx'] * 0.9
-                    edge_collision = True
-
-                if coin['y'] < self.BOUNDARY_MARGIN or coin['y'] > self.BOARD_SIZE - self.BOUNDARY_MARGIN:
-                    coin['vy'] = -coin['vy'] * 0.9
-                    edge_collision = True
-
-                if edge_collision and coin_speed > 3:
-                    self.play_edge_collision_sound(coin_speed)
-                coin['x'] = max(self.BOUNDARY_MARGIN, min(coin['x'], self.BOARD_SIZE - self.BOUNDARY_MARGIN))
-                coin['y'] = max(self.BOUNDARY_MARGIN, min(coin['y'], self.BOARD_SIZE - self.BOUNDARY_MARGIN))
-                self.canvas.coords(coin['id'], coin['x'], coin['y'])
-                speed = math.sqrt(coin['vx']**2 + coin['vy']**2)
-
-                if speed < 0.5:
-                    coin['moving'] = False
-                else:
-                    coins_moving = True
-            for coin in active_coins[:]:
-                for px, py in pocket_positions:
-                    dist_to_pocket = math.hypot(coin['x'] - px, coin['y'] - py)
-
-                    if dist_to_pocket < self.POCKET_RADIUS + coin['radius']:
-                        coin['vx'] = 0
-                        coin['vy'] = 0
-                        coin['moving'] = False
-                        coin['pocketed'] = True
-
-                        if coin['type'] == self.player_coin_colors[self.current_player]:
-                            self.last_pocketed_coin_for_queen = coin.copy()
-                            self.player_scored_in_turn = True
-                            self.foul_by_own_coin = True
-                            self.foul_coin = coin
-                            self.pocketed_player_coins_this_turn += 1
-                        self.animate_into_pocket(coin['id'], px, py)
-                        active_coins.remove(coin)
-
-                        if coin['type'] == 'red':
-                            self.queen_pocketed_sound.play()
-                            self.queen_pocketed_this_turn = True
-                        break
-        self.check_coin_collisions(active_coins)
-        striker_speed = math.sqrt(self.striker_velocity[0]**2 + self.striker_velocity[1]**2)
-
-        if striker_speed <= 0.5:
-            self.striker_velocity = [0, 0]
-        all_coins_slow = True
-        for coin in self.coins:
-            speed = math.sqrt(coin['vx']**2 + coin['vy']**2)
+            if self.drawn_positions.get(item) != position:
+                self.drawn_positions[item] = position
+                self.move_item(item, *position)
 
-            if speed > 0.5:
-                all_coins_slow = False
-            elif speed <= 0.5:
-                coin['vx'], coin['vy'] = 0, 0
-                coin['moving'] = False
+    def move_item(self, item, x, y, **options):
+        # The striker is a retained item, so its moves go through the
+        # renderer to keep its recorded position in step with the canvas.
 
-        if self.striker_moving and all_coins_slow and striker_speed <= 0.5:
+        if item == self.striker_id:
+            self.renderer.update('striker', coords=(x, y), **options)
+            self.renderer.flush()
+            return
+        self.canvas.coords(item, x, y)
 
-            if self.rubbing_channel:
-                self.rubbing_channel.stop()
-                self.rubbing_channel = None
-            self.striker_moving = False
-            self.animation_running = True
-            self.arc_color = "#ff0000"
-            self.update_striker(self.get_slider_value())
-            self.rotate_arc()
-            self.slider_canvas.pack(pady=(5, 20))
+        if options:
+            self.canvas.itemconfig(item, **options)
 
-            def remove_pocketed():
-                for coin in self.coins[:]:
+    def item_coords(self, item):
 
-                    if coin.get('pocketed'):
-                        self.canvas.delete(coin['id'])
-                        self.coins.remove(coin)
-            self.root.after(1, remove_pocketed)
-            self.update_scores_periodic()
-            self.root.after(1, self.end_turn_reset)
-            return
+        if item == self.striker_id:
+            return self.renderer.coords('striker')
+        return self.canvas.coords(item)
+
+    def on_coin_pocketed(self, coin, pocket_x, pocket_y):
+        coin.vx = 0
+        coin.vy = 0
+        coin.moving = False
+        coin.pocketed = True
+
+        if coin.type == self.player_coin_colors[self.current_player]:
+            self.last_pocketed_coin_for_queen = coin.copy()
+            self.player_scored_in_turn = True
+            self.foul_by_own_coin = True
+            self.foul_coin = coin
+            self.pocketed_player_coins_this_turn += 1
+        self.animate_into_pocket(coin.id, pocket_x, pocket_y, sprite=coin.type)
 
-        if self.striker_moving or coins_moving:
-            self.root.after(20, self.move_objects)
+        if coin.type == 'red':
+            self.queen_pocketed_sound.play()
+            self.queen_pocketed_this_turn = True
 
-    def animate_into_pocket(self, obj_id, pocket_x, pocket_y, is_striker=False):
+    def animate_into_pocket(self, obj_id, pocket_x, pocket_y, is_striker=False, sprite=None):
 
         if is_striker:
             self.striker_moving = False
@@ -1143,24 +1230,21 @@ class CarromGame:
             sound.play()
         else:
             self.play_coin_pocket_sound()
-        current_x, current_y = self.canvas.coords(obj_id)
+        current_x, current_y = self.item_coords(obj_id)
         distance = math.hypot(pocket_x - current_x, pocket_y - current_y)
         steps = max(5, int(distance / 5))
         dx = (pocket_x - current_x) / steps
         dy = (pocket_y - current_y) / steps
-        scale_factor = 1.0
-        scale_step = 0.9 ** (1/steps)
 
         def move_obj(step=0):
 
             if step < steps:
                 new_x = current_x + dx * (step + 1)
                 new_y = current_y + dy * (step + 1)
-                scale_factor = scale_step ** step
-                self.canvas.coords(obj_id, new_x, new_y)
-                self.root.after(10, move_obj, step + 1)
+                self.move_item(obj_id, new_x, new_y, **self.pocket_frame(sprite, step / steps))
+                self.scheduler.after(10, move_obj, step + 1)
             else:
-                self.canvas.coords(obj_id, pocket_x, pocket_y)
+                self.move_item(obj_id, pocket_x, pocket_y, **self.pocket_frame(sprite, 1.0))
 
                 if is_striker:
                     self.handle_foul()
@@ -1168,6 +1252,12 @@ class CarromGame:
                     pass
         move_obj()
 
+    def pocket_frame(self, sprite, progress):
+
+        if sprite is None:
+            return {}
+        return {'image': self.sprites.sprite(sprite, progress)}
+
     def get_slider_value(self):
         knob_x = self.slider_canvas.coords(self.slider_knob)[0]
         slider_ratio = (knob_x - 18) / (330 - 36)
@@ -1175,88 +1265,6 @@ class CarromGame:
         max_board_x = self.BOARD_SIZE - self.STRIKER_RADIUS - 127
         return min_board_x + slider_ratio * (max_board_x - min_board_x)
 
-    def check_collisions(self, striker_x, striker_y):
-        striker_mass = 15
-        coin_mass = 5
-        for coin in [c for c in self.coins if not c.get('pocketed')]:
-            coin_x, coin_y = coin['x'], coin['y']
-            dx = coin_x - striker_x
-            dy = coin_y - striker_y
-            distance = math.sqrt(dx * dx + dy * dy)
-            min_distance = self.STRIKER_RADIUS + coin['radius']
-
-            if distance < 1e-10:
-                dx = 0.1
-                dy = 0.1
-                distance = math.sqrt(dx*dx + dy*dy)
-
-            if distance < min_distance:
-                relative_speed = abs(coin['vx'] - self.striker_velocity[0]) + abs(coin['vy'] - self.striker_velocity[1])
-
-                if relative_speed > 3:
-                    self.play_coin_collision_sound(relative_speed)
-                nx = dx / distance
-                ny = dy / distance
-                rvx = coin['vx'] - self.striker_velocity[0]
-                rvy = coin['vy'] - self.striker_velocity[1]
-                vel_along_normal = rvx * nx + rvy * ny
-
-                if vel_along_normal > 0:
-                    continue
-                restitution = 0.9
-                impulse = -(1 + restitution) * vel_along_normal
-                impulse /= (1/coin_mass + 1/striker_mass)
-                impulse_x = impulse * nx
-                impulse_y = impulse * ny
-                coin['vx'] += impulse_x / coin_mass
-                coin['vy'] += impulse_y / coin_mass
-                self.striker_velocity[0] -= impulse_x / striker_mass
-                self.striker_velocity[1] -= impulse_y / striker_mass
-                coin['moving'] = True
-
-    def check_coin_collisions(self, coins):
-        for i in range(len(coins)):
-            coin1 = coins[i]
-            for j in range(i + 1, len(coins)):
-                coin2 = coins[j]
-                dx = coin1['x'] - coin2['x']
-                dy = coin1['y'] - coin2['y']
-                distance = math.sqrt(dx*dx + dy*dy)
-                min_distance = coin1['radius'] + coin2['radius']
-
-                if distance < 1e-10:
-                    dx = 0.1
-                    dy = 0.1
-                    distance = math.sqrt(dx*dx + dy*dy)
-
-                if distance < min_distance:
-                    relative_speed = abs(coin1['vx'] - coin2['vx']) + abs(coin1['vy'] - coin2['vy'])
-
-                    if relative_speed > 3:
-                        self.play_coin_collision_sound(relative_speed)
-                    nx = dx / distance
-                    ny = dy / distance
-                    rvx = coin1['vx'] - coin2['vx']
-                    rvy = coin1['vy'] - coin2['vy']
-                    velocity_along_normal = rvx * nx + rvy * ny
-
-                    if velocity_along_normal > 0:
-                        continue
-                    restitution = 0.9
-                    impulse = -(1 + restitution) * velocity_along_normal / 2
-                    coin1['vx'] += impulse * nx
-                    coin1['vy'] += impulse * ny
-                    coin2['vx'] -= impulse * nx
-                    coin2['vy'] -= impulse * ny
-                    coin1['moving'] = True
-                    coin2['moving'] = True
-                    overlap = min_distance - distance
-                    correction = overlap / 2
-                    coin1['x'] += nx * correction
-                    coin1['y'] += ny * correction
-                    coin2['x'] -= nx * correction
-                    coin2['y'] -= ny * correction
-
     def play_coin_collision_sound(self, speed):
         sound = random.choice(self.coin_collision_sounds)
         volume = min(1.0, speed / 20)
@@ -1269,58 +1277,13 @@ class CarromGame:
         sound.set_volume(volume)
         sound.play()
 
-    def animate_striker_pocket(self, pocket_x, pocket_y):
-        self.striker_moving = False
-        self.check_coin_pocket_collisions()
-        striker_x, striker_y = self.canvas.coords(self.striker_id)
-        distance = math.hypot(pocket_x - striker_x, pocket_y - striker_y)
-        steps = int(distance / 5)
-
-        if steps == 0:
-            self.handle_foul()
-            return
-        dx = (pocket_x - striker_x) / steps
-        dy = (pocket_y - striker_y) / steps
-        scale_factor = 1.0
-        scale_step = 0.9 ** (1/steps)
-
-        def move_striker(step=0):
-
-            if step < steps:
-                new_x = striker_x + dx * (step + 1)
-                new_y = striker_y + dy * (step + 1)
-                scale_factor = scale_step ** step
-                self.canvas.coords(self.striker_id, new_x, new_y)
-                self.root.after(10, move_striker, step + 1)
-            else:
-                self.handle_foul()
-        move_striker()
-
-    def check_coin_pocket_collisions(self):
-        for coin in self.coins:
-
-            if coin.get('pocketed'):
-                continue
-            for pocket_x, pocket_y in self.pocket_positions:
-                dist = math.hypot(coin['x'] - pocket_x, coin['y'] - pocket_y)
-
-                if dist < self.POCKET_RADIUS:
-                    coin['pocketed'] = True
-                    coin['vx'] = 0
-                    coin['vy'] = 0
-                    coin['moving'] = False
-                    coin['x'] = pocket_x
-                    coin['y'] = pocket_y
-                    self.canvas.coords(coin['id'], pocket_x, pocket_y)
-                    break
-
     def handle_foul(self):
         self.prevent_win_animation = True
         self.striker_velocity = [0, 0]
         for coin in self.coins:
-            coin['vx'] = 0
-            coin['vy'] = 0
-            coin['moving'] = False
+            coin.vx = 0
+            coin.vy = 0
+            coin.moving = False
         self.player_scored_in_turn = False
 
         if self.rubbing_channel:
@@ -1328,27 +1291,10 @@ class CarromGame:
             self.rubbing_channel = None
 
         if not self.prevent_foul_animation:
-            canvas_x = self.root.winfo_rootx() + self.canvas.winfo_x() + 25
-            canvas_y = self.root.winfo_rooty() + self.canvas.winfo_y() + 70
-            self.overlay_window = tk.Toplevel(self.root)
-            self.overlay_window.overrideredirect(True)
-            self.overlay_window.geometry(f"{self.BOARD_SIZE}x{self.BOARD_SIZE}+{canvas_x}+{canvas_y}")
-            self.overlay_window.attributes('-alpha', 0.0)
-            self.overlay_window.attributes('-topmost', True)
-            self.overlay_window.configure(bg='black')
-            self.foul_text_label = tk.Label(
-                self.overlay_window,
-                text="FOUL",
-                font=("Arial", 70, "bold"),
-                fg="#FF0000",
-                bg='black'
-            )
-            self.foul_text_label.place(relx=0.5, rely=0.5, anchor='center')
+            self.overlay.show(self.sprites.shade('black'), self.sprites.banners['foul'])
         else:
             self.prevent_foul_animation = False
-        self.animate_foul_text(0)
-        self.fade_overlay(0)
-        self.root.after(1500, self.reset_after_foul)
+        self.scheduler.after(1500, self.reset_after_foul)
 
         if self.pocketed_player_coins_this_turn > 0:
             for i in range(self.pocketed_player_coins_this_turn):
@@ -1359,74 +1305,30 @@ class CarromGame:
         else:
             self.place_penalty_coin()
 
-    def fade_overlay(self, alpha):
-
-        if alpha <= 0.85:
-
-            try:
-                self.overlay_window.attributes('-alpha', alpha)
-                self.root.after(20, lambda: self.fade_overlay(alpha + 0.05))
-
-            except tk.TclError:
-                pass
-
-    def animate_foul_text(self, step):
-
-        try:
-            pulse = 10 * math.sin(step * 0.5)
-            size = 70 + int(pulse)
-            self.foul_text_label.config(font=("Arial", size, "bold"))
-
-            if step < 20:
-                self.root.after(50, lambda: self.animate_foul_text(step + 1))
-
-        except (tk.TclError, AttributeError):
-            pass
-
     def reset_after_foul(self):
-        self.fade_out_overlay(0.7)
+        self.overlay.hide()
 
         def remove_and_reset():
 
             if self.striker_id:
-                self.canvas.delete(self.striker_id)
+                self.renderer.delete('striker')
                 self.striker_id = None
             self.end_turn_reset()
-        self.root.after(1, remove_and_reset)
+        self.scheduler.after(1, remove_and_reset)
         self.striker_moving = False
         self.animation_running = True
         self.arc_color = "#ff0000"
         self.update_striker(self.get_slider_value())
         self.rotate_arc()
         self.slider_canvas.pack(pady=(5, 20))
-        self.foul_text_label = None
-
-    def fade_out_overlay(self, alpha):
-
-        if alpha >= 0:
-
-            try:
-                self.overlay_window.attributes('-alpha', alpha)
-                self.root.after(20, lambda: self.fade_out_overlay(alpha - 0.05))
-
-            except tk.TclError:
-                pass
-        else:
-
-            try:
-                self.overlay_window.destroy()
-                self.overlay_window = None
-
-            except tk.TclError:
-                pass
 
     def rotate_board_180(self):
         for coin in self.coins:
 
-            if not coin.get('pocketed'):
-                coin['x'] = self.BOARD_SIZE - coin['x']
-                coin['y'] = self.BOARD_SIZE - coin['y']
-                self.canvas.coords(coin['id'], coin['x'], coin['y'])
+            if not coin.pocketed:
+                coin.x = self.BOARD_SIZE - coin.x
+                coin.y = self.BOARD_SIZE - coin.y
+                self.canvas.coords(coin.id, coin.x, coin.y)
         self.board_rotated = not self.board_rotated
 
     def end_turn_reset(self):
@@ -1461,67 +1363,25 @@ class CarromGame:
         self.foul_by_own_coin = False
         self.foul_coin = None
         player_color = self.player_coin_colors[self.current_player]
-        remaining = [c for c in self.coins if not c.get('pocketed') and c['type'] == player_color]
-        queen_unhandled = any(c for c in self.coins if c['type'] == 'red' and not c.get('pocketed'))
+        remaining = self.coins.count(player_color)
+        queen_unhandled = self.coins.count('red') > 0
         queen_uncovered = (self.current_player == 0 and not self.player1_queen_covered) or \
                         (self.current_player == 1 and not self.player2_queen_covered)
 
         if not remaining and queen_unhandled and queen_uncovered and self.last_pocketed_coin_for_queen:
             coin_data = self.last_pocketed_coin_for_queen
-            coin_data['pocketed'] = False
-            coin_data['vx'] = 0.0
-            coin_data['vy'] = 0.0
-            coin_data['moving'] = False
-            center_free = True
-            for coin in self.coins:
-
-                if not coin.get('pocketed'):
-                    dx = self.CENTER_X - coin['x']
-                    dy = self.CENTER_Y - coin['y']
-
-                    if math.hypot(dx, dy) < self.COIN_RADIUS * 2:
-                        center_free = False
-                        break
-
-            if center_free:
-                coin_data['x'] = self.CENTER_X
-                coin_data['y'] = self.CENTER_Y
-            else:
-                CENTER_CIRCLE_RADIUS = 60
-                max_attempts = 100
-                for _ in range(max_attempts):
-                    angle = random.uniform(0, 2 * math.pi)
-                    distance = random.uniform(0, CENTER_CIRCLE_RADIUS)
-                    x = self.CENTER_X + distance * math.cos(angle)
-                    y = self.CENTER_Y + distance * math.sin(angle)
-                    collision = False
-                    for c in self.coins:
-
-                        if not c.get('pocketed'):
-                            dx = x - c['x']
-                            dy = y - c['y']
-
-                            if math.hypot(dx, dy) < self.COIN_RADIUS * 2:
-                                collision = True
-                                break
-
-                    if not collision:
-                        coin_data['x'] = x
-                        coin_data['y'] = y
-                        break
-                else:
-                    coin_data['x'] = self.CENTER_X
-                    coin_data['y'] = self.CENTER_Y
-            img = self.white_coin_img if coin_data['type'] == 'white' else self.black_coin_img
-            coin_data['id'] = self.canvas.create_image(coin_data['x'], coin_data['y'], image=img)
+            coin_data.pocketed = False
+            coin_data.vx = 0.0
+            coin_data.vy = 0.0
+            coin_data.moving = False
+            coin_data.x, coin_data.y = self.centre_placement.place(self.coins, self.COIN_RADIUS * 2)
+            img = self.white_coin_img if coin_data.type == 'white' else self.black_coin_img
+            coin_data.id = self.canvas_items.create('coins', 'image', coin_data.x, coin_data.y, image=img)
             self.coins.append(coin_data)
             self.update_scores_periodic()
             self.last_pocketed_coin_for_queen = None
-        for coin in self.coins[:]:
-
-            if coin.get('pocketed'):
-                self.canvas.delete(coin['id'])
-                self.coins.remove(coin)
+        for coin in self.coins.remove_pocketed():
+            self.canvas_items.delete(coin.id)
 
         if not self.player_scored_in_turn and not queen_pocketed:
             self.rotate_board_180()
@@ -1544,7 +1404,7 @@ class CarromGame:
             return
 
         if self.timer_id:
-            self.root.after_cancel(self.timer_id)
+            self.scheduler.cancel(self.timer_id)
             self.timer_id = None
         self.timer_active = True
         self.timer_start_time = time.time()
@@ -1563,19 +1423,23 @@ class CarromGame:
                 self.timer_active = False
                 self.timer_sound.stop()
                 self.timeout_in_progress = True
+                self.scheduler.flush('aim', run=False)
 
                 if self.aim_line:
-                    self.canvas.delete("aim_dot")
+                    self.hide_aim_dots()
                     self.aim_line = None
                     self.drag_start = None
                     self.arc_color = "#ff0000"
                     self.update_arc_position(self.get_slider_value())
-                self.root.after(200, lambda: self.timeout_sound.play())
-                self.root.after(2500, self.end_turn_reset)
+                self.scheduler.after(200, lambda: self.timeout_sound.play())
+                self.scheduler.after(2500, self.end_turn_reset)
             else:
-                self.timer_id = self.root.after(1000, update_timer)
+                self.timer_id = self.scheduler.after(1000, update_timer)
         update_timer()
 
+        if self.is_computer_turn():
+            self.start_computer_turn()
+
     def stop_turn_timer(self):
 
         if self.rotation_active:
@@ -1584,11 +1448,11 @@ class CarromGame:
         self.timer_active = False
 
         if self.timer_id:
-            self.root.after_cancel(self.timer_id)
+            self.scheduler.cancel(self.timer_id)
             self.timer_id = None
 
         if self.border_animation_id:
-            self.root.after_cancel(self.border_animation_id)
+            self.scheduler.cancel(self.border_animation_id)
             self.border_animation_id = None
         self.timer_sound.stop()
 
@@ -1645,20 +1509,20 @@ class CarromGame:
         other_border = self.border_poly2 if self.current_player == 0 else self.border_poly1
         other_canvas = self.border_canvas_for_player2 if self.current_player == 0 else self.border_canvas_for_player1
         other_canvas.itemconfig(other_border, fill="")
-        self.border_animation_id = self.root.after(50, self.animate_border)
+        self.border_animation_id = self.scheduler.after(50, self.animate_border, key='border', pausable=True)
 
     def return_coin_to_center(self, coin):
-        coin['pocketed'] = False
-        coin['x'] = self.CENTER_X
-        coin['y'] = self.CENTER_Y
-        self.canvas.coords(coin['id'], coin['x'], coin['y'])
-        self.canvas.itemconfig(coin['id'], state=tk.NORMAL)
+        coin.pocketed = False
+        coin.x = self.CENTER_X
+        coin.y = self.CENTER_Y
+        self.canvas.coords(coin.id, coin.x, coin.y)
+        self.canvas.itemconfig(coin.id, state=tk.NORMAL, image=self.sprites.sprite(coin.type))
 
     def return_extra_penalty_coin(self):
         player_coin_type = self.player_coin_colors[self.current_player]
         for coin in self.coins:
 
-            if coin.get('pocketed') and coin['type'] == player_coin_type:
+            if coin.pocketed and coin.type == player_coin_type:
                 self.return_coin_to_center(coin)
                 break
 
@@ -1668,74 +1532,17 @@ class CarromGame:
             return
         player_color = self.player_coin_colors[self.current_player]
         img = self.white_coin_img if player_color == 'white' else self.black_coin_img
-        CENTER_CIRCLE_RADIUS = 60
-        max_attempts = 100
-        placed = False
-        for _ in range(max_attempts):
-            angle = random.uniform(0, 2 * math.pi)
-            distance = random.uniform(0, CENTER_CIRCLE_RADIUS)
-            x = self.CENTER_X + distance * math.cos(angle)
-            y = self.CENTER_Y + distance * math.sin(angle)
-            collision = False
-            for coin in self.coins:
-
-                if not coin.get('pocketed'):
-                    dx = x - coin['x']
-                    dy = y - coin['y']
-                    distance_to_coin = math.hypot(dx, dy)
-
-                    if distance_to_coin < self.COIN_RADIUS * 2:
-                        collision = True
-                        break
-
-            if not collision:
-                coin_id = self.canvas.create_image(x, y, image=img)
-                self.coins.append({
-                    'id': coin_id,
-                    'x': x,
-                    'y': y,
-                    'radius': self.COIN_RADIUS,
-                    'vx': 0.0,
-                    'vy': 0.0,
-                    'moving': False,
-                    'type': player_color
-                })
-                placed = True
-                self.update_scores_periodic()
-                break
-
-        if not placed:
-            coin_id = self.canvas.create_image(self.CENTER_X, self.CENTER_Y, image=img)
-            self.coins.append({
-                'id': coin_id,
-                'x': self.CENTER_X,
-                'y': self.CENTER_Y,
-                'radius': self.COIN_RADIUS,
-                'vx': 0.0,
-                'vy': 0.0,
-                'moving': False,
-                'type': player_color
-            })
-            self.update_scores_periodic()
+        x, y = self.centre_placement.place(self.coins, self.COIN_RADIUS * 2)
+        coin_id = self.canvas_items.create('coins', 'image', x, y, image=img)
+        self.coins.append(Coin(coin_id, x, y, player_color, self.COIN_RADIUS))
+        self.update_scores_periodic()
 
     def count_player_coins(self):
-        player_coin_type = self.player_coin_colors[self.current_player]
-        count = 0
-        for coin in self.coins:
-
-            if not coin.get('pocketed') and coin['type'] == player_coin_type:
-                count += 1
-        return count
+        return self.coins.count(self.player_coin_colors[self.current_player])
 
     def update_scores_periodic(self):
-        white_count = sum(1 for coin in self.coins
-
-                         if coin['type'] == 'white' and not coin.get('pocketed'))
-        black_count = sum(1 for coin in self.coins
-
-                         if coin['type'] == 'black' and not coin.get('pocketed'))
-        self.player1_score = 9 - white_count
-        self.player2_score = 9 - black_count
+        self.player1_score = 9 - self.coins.count('white')
+        self.player2_score = 9 - self.coins.count('black')
         self.player1_score_label.config(text=str(self.player1_score))
         self.player2_score_label.config(text=str(self.player2_score))
 
@@ -1759,54 +1566,9 @@ class CarromGame:
             self.show_win_animation("PLAYER 2")
 
     def return_queen_to_center(self):
-        CENTER_CIRCLE_RADIUS = 60
-        max_attempts = 100
-        center_free = True
-        for coin in self.coins:
-            dx = self.CENTER_X - coin['x']
-            dy = self.CENTER_Y - coin['y']
-            distance = math.hypot(dx, dy)
-
-            if distance < self.COIN_RADIUS * 2.5:
-                center_free = False
-                break
-
-        if center_free:
-            x, y = self.CENTER_X, self.CENTER_Y
-        else:
-            placed = False
-            for _ in range(max_attempts):
-                angle = random.uniform(0, 2 * math.pi)
-                distance = random.uniform(0, CENTER_CIRCLE_RADIUS)
-                x = self.CENTER_X + distance * math.cos(angle)
-                y = self.CENTER_Y + distance * math.sin(angle)
-                collision = False
-                for coin in self.coins:
-                    dx = x - coin['x']
-                    dy = y - coin['y']
-                    distance_to_coin = math.hypot(dx, dy)
-
-                    if distance_to_coin < self.COIN_RADIUS * 2.5:
-                        collision = True
-                        break
-
-                if not collision:
-                    placed = True
-                    break
-
-            if not placed:
-                x, y = self.CENTER_X, self.CENTER_Y
-        coin_id = self.canvas.create_image(x, y, image=self.red_coin_img)
-        self.coins.append({
-            'id': coin_id,
-            'x': x,
-            'y': y,
-            'radius': self.COIN_RADIUS,
-            'vx': 0.0,
-            'vy': 0.0,
-            'moving': False,
-            'type': 'red'
-        })
+        x, y = self.centre_placement.place(self.coins, self.COIN_RADIUS * 2.5)
+        coin_id = self.canvas_items.create('coins', 'image', x, y, image=self.red_coin_img)
+        self.coins.append(Coin(coin_id, x, y, 'red', self.COIN_RADIUS))
 
     def show_player1_queen(self):
         self.player1_queen_covered = True
@@ -1821,113 +1583,26 @@ class CarromGame:
         if self.prevent_queen_covered_animation:
             self.prevent_queen_covered_animation = False
             return
-        self.root.after(1,self.stop_turn_timer)
+        self.scheduler.after(1,self.stop_turn_timer)
         self.queen_covered_sound.play()
-        canvas_x = self.root.winfo_rootx() + self.canvas.winfo_x() + 25
-        canvas_y = self.root.winfo_rooty() + self.canvas.winfo_y() + 70
-        self.queen_overlay_window = tk.Toplevel(self.root)
-        self.queen_overlay_window.overrideredirect(True)
-        self.queen_overlay_window.geometry(f"{self.BOARD_SIZE}x{self.BOARD_SIZE}+{canvas_x}+{canvas_y}")
-        self.queen_overlay_window.attributes('-alpha', 0.0)
-        self.queen_overlay_window.attributes('-topmost', True)
-        self.queen_overlay_window.configure(bg='#00FF00')  # Green background
-        self.queen_text_label = tk.Label(
-            self.queen_overlay_window,
-            text="QUEEN COVERED",
-            font=("Arial", 45, "bold"),
-            fg="#0905F8",  # Dark green text
-            bg='#00FF00'   # Green background
+        self.overlay.show(
+            self.sprites.shade('green', 0.7),
+            self.sprites.banners['queen'],
+            hold_ms=2000,
+            on_hidden=lambda: self.scheduler.after(100, self.start_turn_timer)
         )
-        self.queen_text_label.place(relx=0.5, rely=0.5, anchor='center')
-        self.fade_in_queen_overlay(0)
-
-        def fade_out_queen_overlay(alpha):
-
-            if alpha >= 0:
-
-                try:
-                    self.queen_overlay_window.attributes('-alpha', alpha)
-                    self.root.after(20, lambda: fade_out_queen_overlay(alpha - 0.05))
-
-                except tk.TclError:
-                    pass
-            else:
-
-                try:
-                    self.queen_overlay_window.destroy()
-                    self.queen_overlay_window = None
-
-                except tk.TclError:
-                    pass
-                self.root.after(100, self.start_turn_timer)
-        self.root.after(2000, lambda: fade_out_queen_overlay(0.7))
-
-    def fade_in_queen_overlay(self, alpha):
-
-        if alpha <= 0.7:
-
-            try:
-                self.queen_overlay_window.attributes('-alpha', alpha)
-                self.root.after(20, lambda: self.fade_in_queen_overlay(alpha + 0.05))
-
-            except tk.TclError:
-                pass
 
     def show_win_animation(self, winner_name="YOU"):
         self.win_animation_running = True
         self.stop_turn_timer()
         self.win_sound.play()
-        canvas_x = self.root.winfo_rootx() + self.canvas.winfo_x() + 25
-        canvas_y = self.root.winfo_rooty() + self.canvas.winfo_y() + 70
-        self.win_overlay_window = tk.Toplevel(self.root)
-        self.win_overlay_window.overrideredirect(True)
-        self.win_overlay_window.geometry(f"{self.BOARD_SIZE}x{self.BOARD_SIZE}+{canvas_x}+{canvas_y}")
-        self.win_overlay_window.attributes('-alpha', 0.0)
-        self.win_overlay_window.attributes('-topmost', True)
-        self.win_overlay_window.configure(bg='#00FF00')  # Faded green
-        self.win_text_label = tk.Label(
-            self.win_overlay_window,
-            text=f"CONGRATULATIONS\n{winner_name} WINNN...!",
-            font=("Arial", 45, "bold"),
-            fg="#0905F8",
-            bg="#00FF00"
-        )
-        self.win_text_label.place(relx=0.5, rely=0.5, anchor='center')
-        self.animate_win_text(0)
-        self.fade_in_win_overlay(0)
-        self.root.after(5000, self.after_game_complete)
-
-    def animate_win_text(self, step):
-
-        try:
-            pulse = 10 * math.sin(step * 0.5)
-            size = 45 + int(pulse)
-            self.win_text_label.config(font=("Arial", size, "bold"))
-
-            if step < 20:
-                self.root.after(50, lambda: self.animate_win_text(step + 1))
-
-        except (tk.TclError, AttributeError):
-            pass
-
-    def fade_in_win_overlay(self, alpha):
-
-        if alpha <= 0.85:
-
-            try:
-                self.win_overlay_window.attributes('-alpha', alpha)
-                self.root.after(20, lambda: self.fade_in_win_overlay(alpha + 0.05))
-
-            except tk.TclError:
-                pass
+        win_banner = f"win {winner_name}"
+        self.sprites.add_banner(win_banner, f"CONGRATULATIONS\n{winner_name} WINNN...!", 45, "#0905F8")
+        self.overlay.show(self.sprites.shade('green'), self.sprites.banners[win_banner])
+        self.scheduler.after(5000, self.after_game_complete)
 
     def after_game_complete(self):
-
-        try:
-            self.win_overlay_window.destroy()
-
-        except tk.TclError:
-            pass
+        self.overlay.cancel()
         self.main_frame2.pack_forget()
         self.new_game_frame =tk.Frame(self.root, bg='#393939',width=20,height=20)
         self.new_game_frame.place(relx=0.5, rely=0.5, anchor='center', width=150, height=75)
@@ -1957,20 +1632,17 @@ class CarromGame:
         self.bottom_frame.pack(side="top", fill='x', pady=(0, 10))
         self.slider_canvas.pack_forget()
         self.animation_running = False
-
-        if self.arc:
-            self.canvas.delete(self.arc)
-            self.arc = None
-        self.root.after(10, self.new_game_ui)
+        self.hide_arc()
+        self.scheduler.after(10, self.new_game_ui)
 
     def new_game_ui(self):
         self.create_board()
         self.place_coins()
         self.original_coin_positions = []
         for coin in self.coins:
-            self.original_coin_positions.append((coin['x'], coin['y']))
+            self.original_coin_positions.append((coin.x, coin.y))
         self.create_rotation_slider()
-        self.root.after(200, self.update_scores_periodic)
+        self.scheduler.after(200, self.update_scores_periodic)
         self.rotation_active = True
 
     def prevent_foul_animation_once(self):
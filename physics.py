@@ -0,0 +1,1215 @@
+import bisect
+import heapq
+import math
+
+try:
+    import numpy as np
+
+except ImportError:
+    np = None
+
+BOARD_SIZE = 600
+COIN_RADIUS = 12
+STRIKER_RADIUS = 15
+STRIKER_Y = BOARD_SIZE - 117
+BOUNDARY_MARGIN = STRIKER_RADIUS + 29
+POCKET_RADIUS = 12
+POCKET_POSITIONS = [
+    (45, 48),
+    (BOARD_SIZE - 50, 50),
+    (48, 548),
+    (BOARD_SIZE - 52, BOARD_SIZE - 52)
+]
+FRICTION = 0.96
+RESTITUTION = 0.9
+CUSHION_DAMPING = 0.9
+STRIKER_MASS = 15
+COIN_MASS = 5
+REST_SPEED = 0.5
+MAX_TICKS = 5000
+MAX_IMPACTS_PER_TICK = 64
+VECTORIZE_MIN_COINS = 40
+GRID_MIN_COINS = 21
+ZONE_CELL = 20
+ZONES = {}
+COIN_TYPES = ['white', 'black', 'red', 'striker']
+TINY_DISTANCE = math.sqrt(0.1 * 0.1 + 0.1 * 0.1)
+
+class SpatialHash:
+
+    def __init__(self, cell_size):
+        self.cell_size = cell_size
+        self.cells = {}
+        self.keys = {}
+
+    def __len__(self):
+        return len(self.keys)
+
+    def clear(self):
+        self.cells = {}
+        self.keys = {}
+
+    def cell_key(self, x, y):
+        return int(x // self.cell_size), int(y // self.cell_size)
+
+    def insert(self, index, x, y):
+        key = self.cell_key(x, y)
+        self.keys[index] = key
+        self.cells.setdefault(key, set()).add(index)
+
+    def remove(self, index):
+        key = self.keys.pop(index, None)
+
+        if key is None:
+            return
+        members = self.cells[key]
+        members.discard(index)
+
+        if not members:
+            del self.cells[key]
+
+    def move(self, index, x, y):
+        key = self.cell_key(x, y)
+
+        if self.keys.get(index) != key:
+            self.remove(index)
+            self.keys[index] = key
+            self.cells.setdefault(key, set()).add(index)
+
+    def query(self, min_x, min_y, max_x, max_y):
+        found = []
+        cell_size = self.cell_size
+        for cx in range(int(min_x // cell_size), int(max_x // cell_size) + 1):
+            for cy in range(int(min_y // cell_size), int(max_y // cell_size) + 1):
+                members = self.cells.get((cx, cy))
+
+                if members:
+                    found.extend(members)
+        found.sort()
+        return found
+
+def segment_distance_squared(px, py, dx, dy, length):
+    # Squared distance from a point, given relative to a segment's start,
+    # to the segment (dx, dy) whose squared length is `length`.
+    t = (px * dx + py * dy) / length if length > 0 else 0.0
+    t = min(max(t, 0.0), 1.0)
+    ex = px - t * dx
+    ey = py - t * dy
+    return ex * ex + ey * ey
+
+def pocket_zones(pocket_positions, pocket_radius, max_reach, board_size=BOARD_SIZE):
+    # Simulations are created per shot and per search, and nearly all of
+    # them share one board, so the masks are built once per process.
+    key = (tuple(tuple(float(value) for value in position) for position in pocket_positions),
+           float(pocket_radius), float(max_reach), board_size)
+
+    if key not in ZONES:
+        ZONES[key] = PocketZones(pocket_positions, pocket_radius, max_reach, board_size)
+    return ZONES[key]
+
+class PocketZones:
+
+    def __init__(self, pocket_positions, pocket_radius, max_reach, board_size=BOARD_SIZE, cell_size=ZONE_CELL):
+        # A coarse mask over the board: each cell lists the pockets whose
+        # capture circle, grown by one cell, reaches into it. Almost every
+        # cell lists none, so a body there is turned away with one lookup.
+        self.pocket_positions = [tuple(position) for position in pocket_positions]
+        self.pocket_radius = pocket_radius
+        self.cell_size = cell_size
+        self.columns = int(math.ceil(board_size / cell_size))
+        grow = pocket_radius + max_reach + cell_size
+        self.cells = [[()] * self.columns for _ in range(self.columns)]
+        for k, (pocket_x, pocket_y) in enumerate(self.pocket_positions):
+            for column in range(max(0, int((pocket_x - grow) // cell_size)),
+                                min(self.columns, int((pocket_x + grow) // cell_size) + 1)):
+                for row in range(max(0, int((pocket_y - grow) // cell_size)),
+                                 min(self.columns, int((pocket_y + grow) // cell_size) + 1)):
+                    left = column * cell_size
+                    top = row * cell_size
+                    dx = pocket_x - min(max(pocket_x, left), left + cell_size)
+                    dy = pocket_y - min(max(pocket_y, top), top + cell_size)
+
+                    if dx * dx + dy * dy < grow * grow:
+                        self.cells[column][row] += (k,)
+        self.every = tuple(range(len(self.pocket_positions)))
+
+        if np is not None:
+            self.mask = np.array([[bool(near) for near in cells] for cells in self.cells], dtype=bool)
+            self.pockets = np.array(self.pocket_positions, dtype=np.float64).reshape(-1, 2)
+
+    def near(self, x, y):
+        column = min(max(int(x // self.cell_size), 0), self.columns - 1)
+        row = min(max(int(y // self.cell_size), 0), self.columns - 1)
+        return self.cells[column][row]
+
+    def hit(self, start_x, start_y, x, y, reach):
+        # The first pocket whose capture circle the move from (start_x,
+        # start_y) to (x, y) passes through. A move no longer than a cell
+        # stays within a cell of its end, so the end cell's list covers it;
+        # longer moves check every pocket.
+        dx = x - start_x
+        dy = y - start_y
+        length = dx * dx + dy * dy
+        pockets = self.every if length > self.cell_size * self.cell_size else self.near(x, y)
+        limit = (self.pocket_radius + reach) ** 2
+        for k in pockets:
+            pocket_x, pocket_y = self.pocket_positions[k]
+
+            if segment_distance_squared(pocket_x - start_x, pocket_y - start_y, dx, dy, length) < limit:
+                return k
+        return None
+
+    def hits(self, start_x, start_y, x, y, reach):
+        # hit() over arrays of moves; returns which were captured and by
+        # which pocket.
+        dx = x - start_x
+        dy = y - start_y
+        length = dx * dx + dy * dy
+        columns = np.clip((x // self.cell_size).astype(np.intp), 0, self.columns - 1)
+        rows = np.clip((y // self.cell_size).astype(np.intp), 0, self.columns - 1)
+        near = self.mask[columns, rows] | (length > self.cell_size * self.cell_size)
+        captured = np.zeros(near.shape, dtype=bool)
+        pocket_index = np.zeros(near.shape, dtype=np.intp)
+
+        if not near.any():
+            return captured, pocket_index
+        dx, dy, length = dx[near, None], dy[near, None], length[near, None]
+        px = self.pockets[:, 0] - start_x[near, None]
+        py = self.pockets[:, 1] - start_y[near, None]
+        moved = length > 0
+        t = np.where(moved, (px * dx + py * dy) / np.where(moved, length, 1.0), 0.0)
+        t = np.minimum(np.maximum(t, 0.0), 1.0)
+        ex = px - t * dx
+        ey = py - t * dy
+        inside = ex * ex + ey * ey < ((self.pocket_radius + reach[near]) ** 2)[:, None]
+        captured[near] = inside.any(axis=1)
+        pocket_index[near] = inside.argmax(axis=1)
+        return captured, pocket_index
+
+class CoinTable:
+
+    def __init__(self, coins=(), coin_radius=COIN_RADIUS, coin_mass=COIN_MASS, vectorized=None, broadphase=None):
+
+        if vectorized and np is None:
+            raise RuntimeError("NumPy is required for the vectorized coin table")
+        self.mode = vectorized
+        self.coin_radius = coin_radius
+        self.coin_mass = coin_mass
+        self.broadphase = broadphase
+        self.pair_cache = {}
+        self.load(coins)
+
+    def __len__(self):
+        return self.count
+
+    def load(self, coins):
+        x, y, vx, vy, radius, reach, mass, kind, live, moving = [], [], [], [], [], [], [], [], [], []
+        for coin in coins:
+            x.append(float(coin['x']))
+            y.append(float(coin['y']))
+            vx.append(float(coin.get('vx', 0.0)))
+            vy.append(float(coin.get('vy', 0.0)))
+            radius.append(float(coin.get('radius', self.coin_radius)))
+            reach.append(float(coin.get('pocket_reach', radius[-1])))
+            mass.append(float(coin.get('mass', self.coin_mass)))
+            kind.append(COIN_TYPES.index(coin['type']))
+            live.append(not coin.get('pocketed'))
+            moving.append(vx[-1] != 0 or vy[-1] != 0)
+        self.count = len(x)
+        # Both paths give identical results, so small boards skip the NumPy
+        # per-call overhead unless the caller asks for a specific one.
+        self.vectorized = self.mode
+
+        if self.vectorized is None:
+            self.vectorized = np is not None and self.count >= VECTORIZE_MIN_COINS
+
+        if self.vectorized:
+            self.x = np.array(x, dtype=np.float64)
+            self.y = np.array(y, dtype=np.float64)
+            self.vx = np.array(vx, dtype=np.float64)
+            self.vy = np.array(vy, dtype=np.float64)
+            self.radius = np.array(radius, dtype=np.float64)
+            self.pocket_reach = np.array(reach, dtype=np.float64)
+            self.mass = np.array(mass, dtype=np.float64)
+            self.kind = np.array(kind, dtype=np.int8)
+            self.live = np.array(live, dtype=bool)
+            self.moving = np.array(moving, dtype=bool)
+        else:
+            self.x, self.y, self.vx, self.vy = x, y, vx, vy
+            self.radius, self.pocket_reach, self.mass = radius, reach, mass
+            self.kind, self.live, self.moving = kind, live, moving
+        self.max_radius = max(radius, default=self.coin_radius)
+        self.grid = SpatialHash(max(self.coin_radius, self.max_radius) * 2)
+        # Below GRID_MIN_COINS bodies, building and querying the grid costs
+        # more than the all-pairs box test it saves, so only larger boards on
+        # the pure Python path use it. The NumPy path only switches to it
+        # when asked, since its dense pair test runs in C.
+        self.use_grid = self.broadphase
+
+        if self.use_grid is None:
+            self.use_grid = not self.vectorized and self.count >= GRID_MIN_COINS
+
+        if self.use_grid:
+            for i in range(self.count):
+
+                if live[i]:
+                    self.grid.insert(i, x[i], y[i])
+        self.awake = []
+        self.start = {}
+        self.sweeps = []
+        self.resolved = []
+        self.saturated = False
+
+    def update_grid(self, indices):
+
+        if self.use_grid:
+            for i in indices:
+                self.grid.move(i, self.x[i], self.y[i])
+
+    def state(self, index):
+        return (float(self.x[index]), float(self.y[index]), float(self.vx[index]),
+                float(self.vy[index]), bool(self.moving[index]))
+
+    def row(self, index):
+        return {
+            'x': float(self.x[index]),
+            'y': float(self.y[index]),
+            'radius': float(self.radius[index]),
+            'vx': float(self.vx[index]),
+            'vy': float(self.vy[index]),
+            'moving': bool(self.moving[index]),
+            'pocketed': not self.live[index],
+            'type': COIN_TYPES[int(self.kind[index])]
+        }
+
+    def to_dicts(self):
+        return [self.row(i) for i in range(self.count)]
+
+    def live_indices(self):
+
+        if self.vectorized:
+            return np.flatnonzero(self.live)
+        return [i for i in range(self.count) if self.live[i]]
+
+    def pair_indices(self, count):
+        pairs = self.pair_cache.get(count)
+
+        if pairs is None:
+            pairs = np.triu_indices(count, 1)
+            self.pair_cache[count] = pairs
+        return pairs
+
+    def stop(self, index):
+        self.vx[index] = 0.0
+        self.vy[index] = 0.0
+        self.moving[index] = False
+
+    def stop_all(self):
+        for i in range(self.count):
+            self.stop(i)
+
+    def advance(self, friction, low, high, damping, restitution, rest_speed, events):
+        # Bodies fly in straight lines through the tick. Rather than testing
+        # overlaps at fixed substeps, jump to the earliest swept impact,
+        # resolve it and carry on with the rest of the tick. Impact times
+        # wait in a heap; an impact only reschedules the bodies it touched,
+        # and their stamps turn the older entries for them stale.
+
+        if self.vectorized:
+            awake = np.flatnonzero(self.live & self.moving).tolist()
+        else:
+            awake = [i for i in range(self.count) if self.live[i] and self.moving[i]]
+        start = {i: (self.x[i], self.y[i]) for i in awake}
+        self.resolved = []
+        self.stamps = [0] * self.count
+        queue = []
+        self.schedule_pairs(queue, self.impact_pairs(awake, 1.0), 0.0)
+        for i in awake:
+            self.schedule_cushion(queue, i, 0.0, low, high)
+        elapsed = 0.0
+        impacts = 0
+
+        while queue and impacts < MAX_IMPACTS_PER_TICK:
+            time, order, i, j, stamp_i, stamp_j = heapq.heappop(queue)
+
+            if stamp_i != self.stamps[i] or (order == 0 and stamp_j != self.stamps[j]):
+                continue
+            self.drift(awake, time - elapsed)
+            elapsed = max(elapsed, time)
+            impacts += 1
+
+            if order == 1:
+                self.bounce(i, j, low, high, damping, events)
+                touched = (i,)
+            else:
+                for index in (i, j):
+
+                    if index not in start:
+                        start[index] = (self.x[index], self.y[index])
+                        bisect.insort(awake, index)
+                self.collide(i, j, restitution, events)
+                touched = (i, j)
+            for index in touched:
+                self.stamps[index] += 1
+            for index in touched:
+                self.schedule_body(queue, index, awake, elapsed, low, high)
+        self.drift(awake, 1.0 - elapsed)
+        self.saturated = impacts >= MAX_IMPACTS_PER_TICK
+        self.finish_tick(awake, friction, low, high, rest_speed)
+        self.awake = awake
+        self.start = start
+        self.sweeps = []
+        for i in awake:
+            start_x, start_y = start[i]
+            self.sweeps.append((i, min(start_x, self.x[i]), min(start_y, self.y[i]),
+                                max(start_x, self.x[i]), max(start_y, self.y[i])))
+        self.update_grid(awake)
+
+    def coast(self, friction, ticks):
+        # Closed form of `ticks` ticks in which nothing touches anything.
+        travel = (1 - friction ** ticks) / (1 - friction)
+        decay = friction ** ticks
+        awake = [i for i in range(self.count) if self.live[i] and self.moving[i]]
+        for i in awake:
+            self.x[i] += self.vx[i] * travel
+            self.y[i] += self.vy[i] * travel
+            self.vx[i] *= decay
+            self.vy[i] *= decay
+        self.update_grid(awake)
+
+    def impact_pairs(self, awake, window):
+        boxes = []
+        for i in awake:
+            x, y = self.x[i], self.y[i]
+            end_x = x + self.vx[i] * window
+            end_y = y + self.vy[i] * window
+            radius = self.radius[i]
+            boxes.append((min(x, end_x) - radius, min(y, end_y) - radius,
+                          max(x, end_x) + radius, max(y, end_y) + radius))
+        pairs = set()
+        for a in range(len(awake)):
+            box = boxes[a]
+            for b in range(a + 1, len(awake)):
+                other = boxes[b]
+
+                if box[0] <= other[2] and other[0] <= box[2] and box[1] <= other[3] and other[1] <= box[3]:
+                    pairs.add((awake[a], awake[b]))
+        awake_set = set(awake)
+
+        if self.use_grid:
+            for i, box in zip(awake, boxes):
+                reach = self.max_radius
+                for j in self.grid.query(box[0] - reach, box[1] - reach, box[2] + reach, box[3] + reach):
+
+                    if j not in awake_set:
+                        pairs.add((i, j) if i < j else (j, i))
+        else:
+            sleeping = [j for j in self.live_indices() if j not in awake_set]
+            for i in awake:
+                for j in sleeping:
+                    pairs.add((i, j) if i < j else (j, i))
+        return sorted(pairs)
+
+    def schedule_pairs(self, queue, pairs, now):
+        # Queues the first touch of each approaching pair before the tick
+        # ends, timed from the start of the tick.
+
+        if not pairs:
+            return
+
+        if self.vectorized:
+            i, j = np.array(pairs, dtype=np.intp).T
+            dx = self.x[i] - self.x[j]
+            dy = self.y[i] - self.y[j]
+            wx = self.vx[i] - self.vx[j]
+            wy = self.vy[i] - self.vy[j]
+            reach = self.radius[i] + self.radius[j]
+            b = dx * wx + dy * wy
+            c = dx * dx + dy * dy - reach * reach
+            disc = b * b - (wx * wx + wy * wy) * c
+            hit = (b < 0) & ((c <= 0) | (disc >= 0))
+
+            if not hit.any():
+                return
+            root = np.sqrt(np.where(hit, disc, 0.0))
+
+            with np.errstate(divide='ignore', invalid='ignore'):
+                time = now + np.where(c <= 0, 0.0, c / (root - b))
+            for k in np.flatnonzero(hit & (time <= 1.0)).tolist():
+                first = int(i[k])
+                second = int(j[k])
+                heapq.heappush(queue, (float(time[k]), 0, first, second, self.stamps[first], self.stamps[second]))
+            return
+        for i, j in pairs:
+            dx = self.x[i] - self.x[j]
+            dy = self.y[i] - self.y[j]
+            wx = self.vx[i] - self.vx[j]
+            wy = self.vy[i] - self.vy[j]
+            reach = self.radius[i] + self.radius[j]
+            b = dx * wx + dy * wy
+
+            if b >= 0:
+                continue
+            c = dx * dx + dy * dy - reach * reach
+            disc = b * b - (wx * wx + wy * wy) * c
+
+            if c <= 0:
+                time = now
+            elif disc >= 0:
+                time = now + c / (math.sqrt(disc) - b)
+            else:
+                continue
+
+            if time <= 1.0:
+                heapq.heappush(queue, (time, 0, i, j, self.stamps[i], self.stamps[j]))
+
+    def schedule_cushion(self, queue, i, now, low, high):
+        times = []
+        for position, velocity in ((float(self.x[i]), float(self.vx[i])), (float(self.y[i]), float(self.vy[i]))):
+
+            if velocity < 0:
+                time = (low - position) / velocity
+            elif velocity > 0:
+                time = (high - position) / velocity
+            else:
+                time = math.inf
+            times.append(0.0 if time < 0 else time)
+        time_x, time_y = times
+        time = now + min(time_x, time_y)
+
+        if time <= 1.0:
+            axis = 0 if time_x < time_y else 1 if time_y < time_x else 2
+            heapq.heappush(queue, (time, 1, i, axis, self.stamps[i], self.stamps[i]))
+
+    def schedule_body(self, queue, i, awake, now, low, high):
+        # After an impact only this body's course has changed: pair it with
+        # the other awake bodies and whatever rests near its new path.
+        partners = set(awake)
+
+        if self.use_grid:
+            window = 1.0 - now
+            x, y = self.x[i], self.y[i]
+            end_x = x + self.vx[i] * window
+            end_y = y + self.vy[i] * window
+            reach = self.radius[i] + self.max_radius
+            partners.update(self.grid.query(min(x, end_x) - reach, min(y, end_y) - reach,
+                                            max(x, end_x) + reach, max(y, end_y) + reach))
+        else:
+            partners.update(self.live_indices())
+        partners.discard(i)
+        pairs = sorted((i, j) if i < j else (j, i) for j in partners if self.live[j])
+        self.schedule_pairs(queue, pairs, now)
+        self.schedule_cushion(queue, i, now, low, high)
+
+    def drift(self, awake, delay):
+
+        if delay <= 0 or not awake:
+            return
+
+        if self.vectorized:
+            index = np.array(awake, dtype=np.intp)
+            self.x[index] += self.vx[index] * delay
+            self.y[index] += self.vy[index] * delay
+            return
+        for i in awake:
+            self.x[i] += self.vx[i] * delay
+            self.y[i] += self.vy[i] * delay
+
+    def bounce(self, i, axis, low, high, damping, events):
+        vx = float(self.vx[i])
+        vy = float(self.vy[i])
+        events.append(('edge_collision', math.sqrt(vx * vx + vy * vy)))
+
+        if axis != 1:
+            self.x[i] = low if vx < 0 else high
+            self.vx[i] = -vx * damping
+
+        if axis != 0:
+            self.y[i] = low if vy < 0 else high
+            self.vy[i] = -vy * damping
+
+    def collide(self, i, j, restitution, events):
+        dx = float(self.x[i] - self.x[j])
+        dy = float(self.y[i] - self.y[j])
+        distance = math.sqrt(dx * dx + dy * dy)
+
+        if distance < 1e-10:
+            dx = 0.1
+            dy = 0.1
+            distance = TINY_DISTANCE
+        rvx = float(self.vx[i] - self.vx[j])
+        rvy = float(self.vy[i] - self.vy[j])
+        events.append(('coin_collision', abs(rvx) + abs(rvy)))
+        nx = dx / distance
+        ny = dy / distance
+        velocity_along_normal = rvx * nx + rvy * ny
+
+        if velocity_along_normal > 0:
+            return
+        mass_i = float(self.mass[i])
+        mass_j = float(self.mass[j])
+        impulse = -(1 + restitution) * velocity_along_normal / (1 / mass_i + 1 / mass_j)
+        self.vx[i] += impulse * nx / mass_i
+        self.vy[i] += impulse * ny / mass_i
+        self.vx[j] -= impulse * nx / mass_j
+        self.vy[j] -= impulse * ny / mass_j
+        self.moving[i] = True
+        self.moving[j] = True
+
+    def finish_tick(self, awake, friction, low, high, rest_speed):
+
+        if not awake:
+            return
+
+        if self.vectorized:
+            index = np.array(awake, dtype=np.intp)
+            vx = self.vx[index] * friction
+            vy = self.vy[index] * friction
+            self.vx[index] = vx
+            self.vy[index] = vy
+            self.x[index] = np.minimum(np.maximum(self.x[index], low), high)
+            self.y[index] = np.minimum(np.maximum(self.y[index], low), high)
+            self.moving[index] = np.sqrt(vx * vx + vy * vy) >= rest_speed
+            return
+        for i in awake:
+            vx = self.vx[i] * friction
+            vy = self.vy[i] * friction
+            self.vx[i] = vx
+            self.vy[i] = vy
+            self.x[i] = min(max(self.x[i], low), high)
+            self.y[i] = min(max(self.y[i], low), high)
+            self.moving[i] = math.sqrt(vx * vx + vy * vy) >= rest_speed
+
+    def capture(self, zones, events):
+        # Sleeping coins cannot reach a pocket; only coins that moved this
+        # tick or were pushed by the overlap pass are checked, along the
+        # whole move from where they started the tick, so a fast coin cannot
+        # step over a pocket between two ticks.
+        candidates = sorted(set(self.awake).union(self.resolved))
+        hits = []
+        for i in candidates:
+
+            if not self.live[i]:
+                continue
+            x = float(self.x[i])
+            y = float(self.y[i])
+            start_x, start_y = self.start[i] if i in self.start else (x, y)
+            k = zones.hit(float(start_x), float(start_y), x, y, float(self.pocket_reach[i]))
+
+            if k is not None:
+                hits.append((i, k))
+        for i, k in hits:
+            self.stop(i)
+            self.live[i] = False
+            self.grid.remove(i)
+            pocket_x, pocket_y = zones.pocket_positions[k]
+            events.append(('coin_pocketed', i, pocket_x, pocket_y))
+
+    def resolve_contacts(self, restitution, events):
+        # Overlap pass for ticks where the impact search gave up; pushes
+        # penetrating pairs apart and applies their impulses all at once.
+
+        if self.vectorized:
+            self.resolve_contacts_vectorized(restitution, events)
+        else:
+            self.resolve_contacts_fallback(restitution, events)
+
+    def awake_pairs(self):
+        pairs = set()
+
+        if self.use_grid:
+            for i, min_x, min_y, max_x, max_y in self.sweeps:
+
+                if not self.live[i]:
+                    continue
+                reach = self.radius[i] + self.max_radius
+                for j in self.grid.query(min_x - reach, min_y - reach, max_x + reach, max_y + reach):
+
+                    if j != i:
+                        pairs.add((i, j) if i < j else (j, i))
+        else:
+            live = self.live_indices()
+            for i in self.awake:
+
+                if not self.live[i]:
+                    continue
+                for j in live:
+
+                    if j != i:
+                        pairs.add((i, j) if i < j else (j, i))
+        return sorted(pairs)
+
+    def resolve_contacts_vectorized(self, restitution, events):
+        self.resolved = []
+
+        if not self.awake:
+            return
+
+        if self.use_grid:
+            pairs = self.awake_pairs()
+
+            if not pairs:
+                return
+            i, j = np.array(pairs, dtype=np.intp).T
+        else:
+            live = np.flatnonzero(self.live)
+
+            if len(live) < 2:
+                return
+            first, second = self.pair_indices(len(live))
+            i = live[first]
+            j = live[second]
+            awake = np.zeros(self.count, dtype=bool)
+            awake[self.awake] = True
+            involved = awake[i] | awake[j]
+            i, j = i[involved], j[involved]
+        dx = self.x[i] - self.x[j]
+        dy = self.y[i] - self.y[j]
+        distance = np.sqrt(dx * dx + dy * dy)
+        tiny = distance < 1e-10
+
+        if tiny.any():
+            dx[tiny] = 0.1
+            dy[tiny] = 0.1
+            distance[tiny] = TINY_DISTANCE
+        contact = distance < self.radius[i] + self.radius[j]
+
+        if not contact.any():
+            return
+        i, j = i[contact], j[contact]
+        dx, dy, distance = dx[contact], dy[contact], distance[contact]
+        rvx = self.vx[i] - self.vx[j]
+        rvy = self.vy[i] - self.vy[j]
+        nx = dx / distance
+        ny = dy / distance
+        velocity_along_normal = rvx * nx + rvy * ny
+        approaching = velocity_along_normal <= 0
+
+        if not approaching.any():
+            return
+        i, j = i[approaching], j[approaching]
+        nx, ny = nx[approaching], ny[approaching]
+        for relative_speed in (np.abs(rvx[approaching]) + np.abs(rvy[approaching])).tolist():
+            events.append(('coin_collision', relative_speed))
+        impulse = -(1 + restitution) * velocity_along_normal[approaching] / (1 / self.mass[i] + 1 / self.mass[j])
+        share_i = self.mass[j] / (self.mass[i] + self.mass[j])
+        share_j = self.mass[i] / (self.mass[i] + self.mass[j])
+        overlap = self.radius[i] + self.radius[j] - distance[approaching]
+        # Each body's share is summed in pair order (second-body terms before
+        # first-body terms) so the result matches the fallback bit for bit.
+        for values, first, second in ((self.vx, impulse * nx / self.mass[i], impulse * nx / self.mass[j]),
+                                      (self.vy, impulse * ny / self.mass[i], impulse * ny / self.mass[j]),
+                                      (self.x, overlap * share_i * nx, overlap * share_j * nx),
+                                      (self.y, overlap * share_i * ny, overlap * share_j * ny)):
+            total = np.zeros(self.count)
+            np.add.at(total, j, -second)
+            np.add.at(total, i, first)
+            values += total
+        self.moving[i] = True
+        self.moving[j] = True
+        self.resolved = np.union1d(i, j).tolist()
+        self.update_grid(self.resolved)
+
+    def resolve_contacts_fallback(self, restitution, events):
+        self.resolved = []
+        contacts = []
+        for i, j in self.awake_pairs():
+            dx = self.x[i] - self.x[j]
+            dy = self.y[i] - self.y[j]
+            distance = math.sqrt(dx * dx + dy * dy)
+
+            if distance < 1e-10:
+                dx = 0.1
+                dy = 0.1
+                distance = TINY_DISTANCE
+
+            if distance < self.radius[i] + self.radius[j]:
+                contacts.append((i, j, dx, dy, distance))
+        dvx = [0.0] * self.count
+        dvy = [0.0] * self.count
+        dx_total = [0.0] * self.count
+        dy_total = [0.0] * self.count
+        resolved = set()
+        for i, j, dx, dy, distance in contacts:
+            rvx = self.vx[i] - self.vx[j]
+            rvy = self.vy[i] - self.vy[j]
+            nx = dx / distance
+            ny = dy / distance
+            velocity_along_normal = rvx * nx + rvy * ny
+
+            if velocity_along_normal > 0:
+                continue
+            events.append(('coin_collision', abs(rvx) + abs(rvy)))
+            mass_i = self.mass[i]
+            mass_j = self.mass[j]
+            impulse = -(1 + restitution) * velocity_along_normal / (1 / mass_i + 1 / mass_j)
+            overlap = self.radius[i] + self.radius[j] - distance
+            share_i = mass_j / (mass_i + mass_j)
+            share_j = mass_i / (mass_i + mass_j)
+            dvx[i] += impulse * nx / mass_i
+            dvy[i] += impulse * ny / mass_i
+            dvx[j] -= impulse * nx / mass_j
+            dvy[j] -= impulse * ny / mass_j
+            dx_total[i] += overlap * share_i * nx
+            dy_total[i] += overlap * share_i * ny
+            dx_total[j] -= overlap * share_j * nx
+            dy_total[j] -= overlap * share_j * ny
+            self.moving[i] = True
+            self.moving[j] = True
+            resolved.update((i, j))
+
+        if not resolved:
+            return
+        for i in range(self.count):
+            self.vx[i] += dvx[i]
+            self.vy[i] += dvy[i]
+            self.x[i] += dx_total[i]
+            self.y[i] += dy_total[i]
+        self.resolved = sorted(resolved)
+        self.update_grid(self.resolved)
+
+    def settle(self, rest_speed):
+        # Everything outside this tick's awake and resolved sets is already
+        # asleep with zero velocity.
+        candidates = sorted(set(self.awake).union(self.resolved))
+
+        if self.vectorized:
+            candidates = np.array(candidates, dtype=np.intp)
+            vx = self.vx[candidates]
+            vy = self.vy[candidates]
+            slow = np.sqrt(vx * vx + vy * vy) <= rest_speed
+            asleep = candidates[slow]
+            self.vx[asleep] = 0.0
+            self.vy[asleep] = 0.0
+            self.moving[asleep] = False
+            return bool(slow.all())
+        all_slow = True
+        for i in candidates:
+
+            if math.sqrt(self.vx[i] * self.vx[i] + self.vy[i] * self.vy[i]) > rest_speed:
+                all_slow = False
+            else:
+                self.stop(i)
+        return all_slow
+
+class BoardSimulation:
+
+    def __init__(self, board_size=BOARD_SIZE, coin_radius=COIN_RADIUS, striker_radius=STRIKER_RADIUS,
+                 boundary_margin=BOUNDARY_MARGIN, pocket_positions=None, pocket_radius=POCKET_RADIUS,
+                 friction=FRICTION, restitution=RESTITUTION, cushion_damping=CUSHION_DAMPING,
+                 striker_mass=STRIKER_MASS, coin_mass=COIN_MASS, rest_speed=REST_SPEED, vectorized=None,
+                 broadphase=None):
+        self.board_size = board_size
+        self.coin_radius = coin_radius
+        self.striker_radius = striker_radius
+        self.boundary_margin = boundary_margin
+        self.pocket_positions = list(pocket_positions or POCKET_POSITIONS)
+        self.pocket_radius = pocket_radius
+        self.friction = friction
+        self.restitution = restitution
+        self.cushion_damping = cushion_damping
+        self.striker_mass = striker_mass
+        self.coin_mass = coin_mass
+        self.rest_speed = rest_speed
+        self.table = CoinTable(coin_radius=coin_radius, coin_mass=coin_mass, vectorized=vectorized,
+                               broadphase=broadphase)
+        self.reset([])
+
+    @property
+    def coins(self):
+        return [self.table.row(i) for i in range(self.striker_index)]
+
+    @property
+    def striker(self):
+        return self.table.row(self.striker_index)
+
+    def reset(self, coins, striker_x=None, striker_y=None):
+        bodies = list(coins)
+
+        if striker_x is None:
+            striker_x = self.board_size // 2
+
+        if striker_y is None:
+            striker_y = self.board_size - 117
+        # The striker is the last body in the table; it only differs from the
+        # coins by mass and by needing to cover half its radius to drop.
+        bodies.append({
+            'x': striker_x,
+            'y': striker_y,
+            'radius': self.striker_radius,
+            'pocket_reach': self.striker_radius / 2,
+            'mass': self.striker_mass,
+            'type': 'striker'
+        })
+        self.table.load(bodies)
+        self.striker_index = len(bodies) - 1
+        self.running = False
+        self.ticks = 0
+        self.pocket_zones = pocket_zones(self.pocket_positions, self.pocket_radius,
+                                         max(float(reach) for reach in self.table.pocket_reach), self.board_size)
+
+    def strike(self, vx, vy):
+        self.table.vx[self.striker_index] = float(vx)
+        self.table.vy[self.striker_index] = float(vy)
+        self.table.moving[self.striker_index] = True
+        self.running = True
+
+    def run(self, max_ticks=MAX_TICKS):
+        events = []
+
+        while self.running and self.ticks < max_ticks:
+            events.extend(self.step())
+        return events
+
+    def run_events(self, max_ticks=MAX_TICKS):
+        # Between events a moving body covers v * (1 + f + f^2 + ...), so
+        # quiet stretches are skipped in closed form and only the ticks that
+        # hold an impact, a cushion, a pocket drop or a stop are stepped.
+        events = []
+
+        while self.running and self.ticks < max_ticks:
+            skip = min(self.quiet_ticks(), max_ticks - self.ticks - 1)
+
+            if skip > 0:
+                self.table.coast(self.friction, skip)
+                self.ticks += skip
+            events.extend(self.step())
+        return events
+
+    def quiet_ticks(self):
+        table = self.table
+        live = [i for i in range(table.count) if table.live[i]]
+        awake = [i for i in live if table.moving[i]]
+
+        if not awake:
+            return 0
+        friction = self.friction
+        stops = {}
+        for i in awake:
+            speed = math.sqrt(float(table.vx[i] * table.vx[i] + table.vy[i] * table.vy[i]))
+
+            if speed <= self.rest_speed:
+                stops[i] = 1
+            else:
+                stops[i] = max(1, math.ceil(math.log(self.rest_speed / speed) / math.log(friction)))
+        # travel[n] is how far a body has gone, in units of its current
+        # velocity, after n more ticks.
+        travel = [0.0]
+        decay = 1.0
+        for _ in range(max(stops.values())):
+            travel.append(travel[-1] + decay)
+            decay *= friction
+        quiet = min(stops.values()) - 1
+        low = self.boundary_margin
+        high = self.board_size - self.boundary_margin
+        for i in awake:
+            x, y, vx, vy = float(table.x[i]), float(table.y[i]), float(table.vx[i]), float(table.vy[i])
+            for position, velocity in ((x, vx), (y, vy)):
+
+                if velocity < 0:
+                    quiet = min(quiet, bisect.bisect_right(travel, max((low - position) / velocity, 0.0)) - 1)
+                elif velocity > 0:
+                    quiet = min(quiet, bisect.bisect_right(travel, max((high - position) / velocity, 0.0)) - 1)
+            speed_squared = vx * vx + vy * vy
+            for pocket_x, pocket_y in self.pocket_positions:
+                dx = x - pocket_x
+                dy = y - pocket_y
+                reach = self.pocket_radius + float(table.pocket_reach[i])
+                b = dx * vx + dy * vy
+                disc = b * b - speed_squared * (dx * dx + dy * dy - reach * reach)
+
+                if disc <= 0:
+                    continue
+                root = math.sqrt(disc)
+                enter = (-b - root) / speed_squared
+                leave = (-b + root) / speed_squared
+                # A tick captures a body whose move crosses the circle, so
+                # the first tick that ends past the entry point is the one.
+                n = bisect.bisect_right(travel, enter, 1)
+
+                if n <= stops[i] and travel[n - 1] < leave:
+                    quiet = min(quiet, n - 1)
+            for j in live:
+
+                if j == i or (j < i and j in stops):
+                    continue
+                dx = x - float(table.x[j])
+                dy = y - float(table.y[j])
+                wx = vx - float(table.vx[j])
+                wy = vy - float(table.vy[j])
+                reach = float(table.radius[i] + table.radius[j])
+                b = dx * wx + dy * wy
+
+                if b >= 0:
+                    continue
+                c = dx * dx + dy * dy - reach * reach
+                disc = b * b - (wx * wx + wy * wy) * c
+
+                if c <= 0:
+                    return 0
+                elif disc >= 0:
+                    quiet = min(quiet, bisect.bisect_right(travel, c / (math.sqrt(disc) - b)) - 1)
+
+            if quiet <= 0:
+                return 0
+        return quiet
+
+    def step(self):
+        events = []
+
+        if not self.running:
+            return events
+        table = self.table
+        low = self.boundary_margin
+        high = self.board_size - self.boundary_margin
+        table.advance(self.friction, low, high, self.cushion_damping, self.restitution, self.rest_speed, events)
+
+        if table.saturated:
+            table.resolve_contacts(self.restitution, events)
+        table.capture(self.pocket_zones, events)
+        self.ticks += 1
+
+        if not table.live[self.striker_index]:
+            for k, event in enumerate(events):
+
+                if event[0] == 'coin_pocketed' and event[1] == self.striker_index:
+                    events[k] = ('striker_pocketed', event[2], event[3])
+            self.stop_all()
+            return events
+
+        if table.settle(self.rest_speed):
+            self.stop_all()
+            events.append(('rest',))
+        return events
+
+    def stop_all(self):
+        self.running = False
+        self.table.stop_all()
+
+class BatchSimulation:
+
+    def __init__(self, board_size=BOARD_SIZE, coin_radius=COIN_RADIUS, striker_radius=STRIKER_RADIUS,
+                 boundary_margin=BOUNDARY_MARGIN, pocket_positions=None, pocket_radius=POCKET_RADIUS,
+                 friction=FRICTION, restitution=RESTITUTION, cushion_damping=CUSHION_DAMPING,
+                 striker_mass=STRIKER_MASS, coin_mass=COIN_MASS, rest_speed=REST_SPEED):
+
+        if np is None:
+            raise RuntimeError("NumPy is required for batched simulation")
+        self.board_size = board_size
+        self.coin_radius = coin_radius
+        self.striker_radius = striker_radius
+        self.boundary_margin = boundary_margin
+        self.pocket_positions = np.array(pocket_positions or POCKET_POSITIONS, dtype=np.float64)
+        self.pocket_radius = pocket_radius
+        self.friction = friction
+        self.restitution = restitution
+        self.cushion_damping = cushion_damping
+        self.striker_mass = striker_mass
+        self.coin_mass = coin_mass
+        self.rest_speed = rest_speed
+        self.reset([], [])
+
+    def reset(self, coins, strikes):
+        # Every board starts from the same coins; only the striker differs.
+        # strikes holds one (striker_x, striker_y, vx, vy) per board.
+        coins = list(coins)
+        count = len(coins) + 1
+        boards = len(strikes)
+        self.striker_index = count - 1
+        self.kind = [coin['type'] for coin in coins] + ['striker']
+        self.radius = np.array([float(coin.get('radius', self.coin_radius)) for coin in coins] +
+                               [float(self.striker_radius)])
+        self.mass = np.array([float(self.coin_mass)] * len(coins) + [float(self.striker_mass)])
+        self.pocket_reach = self.radius.copy()
+        self.pocket_reach[-1] = self.striker_radius / 2
+        self.pocket_zones = pocket_zones(self.pocket_positions, self.pocket_radius, self.pocket_reach.max(),
+                                         self.board_size)
+        self.state = np.zeros((boards, count, 4))
+        for k, coin in enumerate(coins):
+            self.state[:, k] = (coin['x'], coin['y'], coin.get('vx', 0.0), coin.get('vy', 0.0))
+
+        if boards:
+            self.state[:, -1] = np.array(strikes, dtype=np.float64).reshape(boards, 4)
+        self.live = np.tile([not coin.get('pocketed') for coin in coins] + [True], (boards, 1))
+        self.moving = self.live & ((self.state[..., 2] != 0) | (self.state[..., 3] != 0))
+        self.ticks = np.zeros(boards, dtype=np.int64)
+        self.pocketed_at = np.full((boards, count), -1, dtype=np.int64)
+        self.fouls = np.zeros(boards, dtype=bool)
+        self.first, self.second = np.triu_indices(count, 1)
+        self.active = np.flatnonzero(self.moving.any(axis=1))
+
+    def __len__(self):
+        return len(self.state)
+
+    @property
+    def running(self):
+        return len(self.active) > 0
+
+    def run(self, max_ticks=MAX_TICKS):
+
+        while self.running and self.ticks[self.active].max() < max_ticks:
+            self.step()
+
+    def coins(self, board):
+        x, y, vx, vy = self.state[board].T
+        return [{
+            'x': float(x[k]),
+            'y': float(y[k]),
+            'radius': float(self.radius[k]),
+            'vx': float(vx[k]),
+            'vy': float(vy[k]),
+            'moving': bool(self.moving[board, k]),
+            'pocketed': not self.live[board, k],
+            'type': self.kind[k]
+        } for k in range(self.striker_index)]
+
+    def step(self):
+        # The same impact search as CoinTable.advance, with one impact per
+        # board per pass. Each impact is timed from the current positions
+        # rather than from the start of the tick, so positions can differ
+        # from BoardSimulation in the last bits; what gets pocketed, and
+        # when, does not.
+        boards = self.active
+
+        if not len(boards):
+            return
+        state = self.state[boards]
+        live = self.live[boards]
+        moving = self.moving[boards]
+        x, y, vx, vy = state[..., 0], state[..., 1], state[..., 2], state[..., 3]
+        start_x = x.copy()
+        start_y = y.copy()
+        low = self.boundary_margin
+        high = self.board_size - self.boundary_margin
+        first, second = self.first, self.second
+        elapsed = np.zeros(len(boards))
+        searching = moving.any(axis=1)
+        for _ in range(MAX_IMPACTS_PER_TICK):
+            rows = np.flatnonzero(searching)
+
+            if not len(rows):
+                break
+            window = 1.0 - elapsed[rows]
+            pair_time, pair = self.pair_impacts(x[rows], y[rows], vx[rows], vy[rows], live[rows], moving[rows])
+            cushion_time, body, axis = self.cushion_impacts(x[rows], y[rows], vx[rows], vy[rows],
+                                                            live[rows] & moving[rows], low, high)
+            use_pair = pair_time <= cushion_time
+            delay = np.where(use_pair, pair_time, cushion_time)
+            hit = delay <= window
+            searching[rows[~hit]] = False
+            rows, delay, use_pair = rows[hit], delay[hit], use_pair[hit]
+            pair, body, axis = pair[hit], body[hit], axis[hit]
+            x[rows] += vx[rows] * delay[:, None]
+            y[rows] += vy[rows] * delay[:, None]
+            elapsed[rows] += delay
+            bounced = ~use_pair
+            self.bounce(x, y, vx, vy, rows[bounced], body[bounced], axis[bounced], low, high)
+            self.collide(x, y, vx, vy, moving, rows[use_pair], first[pair[use_pair]], second[pair[use_pair]])
+        remaining = (1.0 - elapsed)[:, None]
+        x += vx * remaining
+        y += vy * remaining
+        vx *= self.friction
+        vy *= self.friction
+        np.clip(x, low, high, out=x)
+        np.clip(y, low, high, out=y)
+        speed = np.sqrt(vx * vx + vy * vy)
+        moving[:] = speed >= self.rest_speed
+        reach = np.broadcast_to(self.pocket_reach, x.shape)
+        captured = live & self.pocket_zones.hits(start_x, start_y, x, y, reach)[0]
+        ticks = self.ticks[boards] + 1
+
+        if captured.any():
+            live &= ~captured
+            vx[captured] = 0.0
+            vy[captured] = 0.0
+            moving &= ~captured
+            pocketed_at = self.pocketed_at[boards]
+            pocketed_at[captured] = np.broadcast_to(ticks[:, None], captured.shape)[captured]
+            self.pocketed_at[boards] = pocketed_at
+        foul = captured[:, -1]
+        slow = speed <= self.rest_speed
+        vx[slow] = 0.0
+        vy[slow] = 0.0
+        moving &= ~slow
+        done = foul | (slow | ~live).all(axis=1)
+        vx[done] = 0.0
+        vy[done] = 0.0
+        moving[done] = False
+        self.state[boards] = state
+        self.live[boards] = live
+        self.moving[boards] = moving
+        self.ticks[boards] = ticks
+        self.fouls[boards] |= foul
+        self.active = boards[~done]
+
+    def pair_impacts(self, x, y, vx, vy, live, moving):
+        first, second = self.first, self.second
+        dx = x[:, first] - x[:, second]
+        dy = y[:, first] - y[:, second]
+        wx = vx[:, first] - vx[:, second]
+        wy = vy[:, first] - vy[:, second]
+        reach = self.radius[first] + self.radius[second]
+        b = dx * wx + dy * wy
+        c = dx * dx + dy * dy - reach * reach
+        disc = b * b - (wx * wx + wy * wy) * c
+        candidate = live[:, first] & live[:, second] & (moving[:, first] | moving[:, second])
+        hit = candidate & (b < 0) & ((c <= 0) | (disc >= 0))
+        root = np.sqrt(np.where(hit, disc, 0.0))
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            time = np.where(c <= 0, 0.0, c / (root - b))
+        time = np.where(hit, time, np.inf)
+        pair = np.argmin(time, axis=1)
+        return time[np.arange(len(time)), pair], pair
+
+    def cushion_impacts(self, x, y, vx, vy, awake, low, high):
+        times = []
+        for position, velocity in ((x, vx), (y, vy)):
+            time = np.full(position.shape, np.inf)
+            toward_low = awake & (velocity < 0)
+            toward_high = awake & (velocity > 0)
+            time[toward_low] = (low - position[toward_low]) / velocity[toward_low]
+            time[toward_high] = (high - position[toward_high]) / velocity[toward_high]
+            times.append(np.where(time < 0, 0.0, time))
+        time_x, time_y = times
+        time = np.minimum(time_x, time_y)
+        body = np.argmin(time, axis=1)
+        rows = np.arange(len(time))
+        time_x, time_y = time_x[rows, body], time_y[rows, body]
+        axis = np.where(time_x < time_y, 0, np.where(time_y < time_x, 1, 2))
+        return time[rows, body], body, axis
+
+    def bounce(self, x, y, vx, vy, rows, body, axis, low, high):
+        for position, velocity, skip in ((x, vx, 1), (y, vy, 0)):
+            hit = axis != skip
+            row, index = rows[hit], body[hit]
+            speed = velocity[row, index]
+            position[row, index] = np.where(speed < 0, low, high)
+            velocity[row, index] = -speed * self.cushion_damping
+
+    def collide(self, x, y, vx, vy, moving, rows, i, j):
+
+        if not len(rows):
+            return
+        dx = x[rows, i] - x[rows, j]
+        dy = y[rows, i] - y[rows, j]
+        distance = np.sqrt(dx * dx + dy * dy)
+        tiny = distance < 1e-10
+        dx[tiny] = 0.1
+        dy[tiny] = 0.1
+        distance[tiny] = TINY_DISTANCE
+        nx = dx / distance
+        ny = dy / distance
+        velocity_along_normal = (vx[rows, i] - vx[rows, j]) * nx + (vy[rows, i] - vy[rows, j]) * ny
+        approaching = velocity_along_normal <= 0
+        rows, i, j = rows[approaching], i[approaching], j[approaching]
+        nx, ny = nx[approaching], ny[approaching]
+        mass_i = self.mass[i]
+        mass_j = self.mass[j]
+        impulse = -(1 + self.restitution) * velocity_along_normal[approaching] / (1 / mass_i + 1 / mass_j)
+        vx[rows, i] += impulse * nx / mass_i
+        vy[rows, i] += impulse * ny / mass_i
+        vx[rows, j] -= impulse * nx / mass_j
+        vy[rows, j] -= impulse * ny / mass_j
+        moving[rows, i] = True
+        moving[rows, j] = True
@@ -0,0 +1,64 @@
+import collections
+import threading
+import time
+
+PhysicsSnapshot = collections.namedtuple('PhysicsSnapshot', ['tick', 'time', 'bodies', 'running'])
+
+class PhysicsWorker:
+
+    def __init__(self, simulation, tick_seconds=0.02, max_catch_up_ticks=5, buffer_size=8):
+        # The worker owns the simulation until it stops. Snapshots go into a
+        # bounded deque and events into an unbounded one; both are appended
+        # here and read from the Tk thread without any further locking.
+        self.simulation = simulation
+        self.tick_seconds = tick_seconds
+        self.max_catch_up_ticks = max_catch_up_ticks
+        self.snapshots = collections.deque(maxlen=buffer_size)
+        self.events = collections.deque()
+        self.stop_event = threading.Event()
+        self.thread = threading.Thread(target=self.run, daemon=True)
+
+    def start(self):
+        self.publish(time.perf_counter())
+        self.thread.start()
+
+    def stop(self):
+        self.stop_event.set()
+
+    @property
+    def running(self):
+        return self.thread.is_alive()
+
+    @property
+    def stopped(self):
+        return self.stop_event.is_set()
+
+    def publish(self, now):
+        simulation = self.simulation
+        table = simulation.table
+        bodies = tuple((float(table.x[i]), float(table.y[i]), bool(table.moving[i])) for i in range(table.count))
+        self.snapshots.append(PhysicsSnapshot(simulation.ticks, now, bodies, simulation.running))
+
+    def run(self):
+        next_tick = time.perf_counter()
+
+        while self.simulation.running and not self.stop_event.is_set():
+            next_tick += self.tick_seconds
+            delay = next_tick - time.perf_counter()
+
+            if delay > 0:
+                self.stop_event.wait(delay)
+            elif -delay > self.tick_seconds * self.max_catch_up_ticks:
+                next_tick = time.perf_counter()
+            self.events.extend(self.simulation.step())
+            self.publish(next_tick)
+
+    def latest(self, count=2):
+        return list(self.snapshots.copy())[-count:]
+
+    def drain_events(self):
+        events = []
+
+        while self.events:
+            events.append(self.events.popleft())
+        return events
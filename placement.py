@@ -0,0 +1,297 @@
+import bisect
+import math
+
+def blocked_spans(coins, y, radius):
+    # Each coin close enough to the line blocks an open interval of x; the
+    # spans are kept as inclusive whole-pixel ranges, merged and sorted.
+    spans = []
+    for coin in coins:
+
+        if coin.pocketed:
+            continue
+        reach = radius + coin.radius
+        dy = y - coin.y
+
+        if abs(dy) >= reach:
+            continue
+        half = math.sqrt(reach * reach - dy * dy)
+        low = math.floor(coin.x - half) + 1
+        high = math.ceil(coin.x + half) - 1
+
+        if low <= high:
+            spans.append((low, high))
+    spans.sort()
+    merged = []
+    for low, high in spans:
+
+        if merged and low <= merged[-1][1] + 1:
+            merged[-1][1] = max(merged[-1][1], high)
+        else:
+            merged.append([low, high])
+    return [tuple(span) for span in merged]
+
+class StrikerBaseline:
+
+    def __init__(self, y, radius, min_x, max_x):
+        self.y = y
+        self.radius = radius
+        self.min_x = min_x
+        self.max_x = max_x
+        self.key = None
+        self.spans = []
+        self.starts = []
+
+    def update(self, coins):
+        key = tuple((coin.x, coin.y, coin.radius) for coin in coins if not coin.pocketed)
+
+        if key != self.key:
+            self.key = key
+            self.spans = blocked_spans(coins, self.y, self.radius)
+            self.starts = [low for low, high in self.spans]
+        return self.spans
+
+    def nearest_free(self, coins, target_x):
+        # Same answer as stepping one pixel each way from target_x: the
+        # nearest free pixel, ties to the right, searching at most one pixel
+        # past either end of the baseline.
+        self.update(coins)
+        index = bisect.bisect_right(self.starts, target_x) - 1
+
+        if index < 0 or self.spans[index][1] < target_x:
+            return target_x
+        low, high = self.spans[index]
+        left = low - 1 if low - 1 >= self.min_x - 1 else None
+        right = high + 1 if high + 1 <= self.max_x + 1 else None
+
+        if left is not None and right is not None:
+            return left if target_x - left < right - target_x else right
+        elif left is not None:
+            return left
+        elif right is not None:
+            return right
+        return target_x
+
+class CentreSpots:
+
+    def __init__(self, placement, clearance):
+        # Candidate spots for one clearance and which of them are free. The
+        # free spot nearest the centre is the centre itself, the point of one
+        # coin's clearance circle closest to the centre, or a crossing of two
+        # clearance circles. Circles are grown by a hair so the spots land
+        # just clear of the coins instead of on their edge. Spots are built
+        # from sources, one coin or a pair, and follow the coins one at a
+        # time: only spots near a coin that came or went are looked at again.
+        self.placement = placement
+        self.clearance = clearance
+        self.reach = clearance + placement.margin
+        self.positions = set()
+        self.sources = {}
+        self.by_coin = {}
+        self.counts = {}
+        self.free = set()
+        self.unknown = set()
+        self.register((), [(placement.centre_x, placement.centre_y)])
+
+    def register(self, source, spots):
+        limit = self.placement.max_radius ** 2
+        centre_x = self.placement.centre_x
+        centre_y = self.placement.centre_y
+        spots = [spot for spot in spots if (spot[0] - centre_x) ** 2 + (spot[1] - centre_y) ** 2 <= limit]
+        self.sources[source] = spots
+        for coin in source:
+            self.by_coin.setdefault(coin, set()).add(source)
+        for spot in spots:
+
+            if spot in self.counts:
+                self.counts[spot] += 1
+            else:
+                self.counts[spot] = 1
+                self.unknown.add(spot)
+
+    def sync(self):
+        positions = self.placement.positions
+        for coin in self.positions - positions:
+            self.remove(coin)
+        for coin in positions - self.positions:
+            self.add(coin)
+
+    def add(self, coin):
+        x, y = coin
+        limit = self.clearance * self.clearance
+        self.free = {spot for spot in self.free if (spot[0] - x) ** 2 + (spot[1] - y) ** 2 >= limit}
+        reach = self.reach
+        dx = self.placement.centre_x - x
+        dy = self.placement.centre_y - y
+        distance = math.hypot(dx, dy)
+
+        if distance == 0:
+            self.register((coin,), [(x + reach, y)])
+        else:
+            self.register((coin,), [(x + dx / distance * reach, y + dy / distance * reach)])
+        for other in self.placement.nearby(x, y, 2 * reach):
+
+            if other in self.positions:
+                source = (coin, other) if coin < other else (other, coin)
+                spots = self.crossings(*source)
+
+                if spots:
+                    self.register(source, spots)
+        self.positions.add(coin)
+
+    def crossings(self, first, second):
+        x1, y1 = first
+        x2, y2 = second
+        dx = x2 - x1
+        dy = y2 - y1
+        distance = math.hypot(dx, dy)
+        reach = self.reach
+
+        if distance == 0 or distance >= 2 * reach:
+            return []
+        along = distance / 2
+        across = math.sqrt(reach * reach - along * along)
+        mid_x = x1 + dx / 2
+        mid_y = y1 + dy / 2
+        return [(mid_x - dy / distance * across, mid_y + dx / distance * across),
+                (mid_x + dy / distance * across, mid_y - dx / distance * across)]
+
+    def remove(self, coin):
+        self.positions.discard(coin)
+        for source in self.by_coin.pop(coin, ()):
+            for other in source:
+
+                if other != coin:
+                    self.by_coin[other].discard(source)
+            for spot in self.sources.pop(source):
+                self.counts[spot] -= 1
+
+                if not self.counts[spot]:
+                    del self.counts[spot]
+                    self.free.discard(spot)
+                    self.unknown.discard(spot)
+        # Spots this coin was keeping blocked may be clear now.
+        x, y = coin
+        limit = self.clearance * self.clearance
+        for spot in self.counts:
+
+            if (spot[0] - x) ** 2 + (spot[1] - y) ** 2 < limit and spot not in self.free:
+                self.unknown.add(spot)
+
+    def nearest(self):
+        # Spots are only checked when they could beat the nearest one known
+        # to be free; whatever a check finds is kept until a coin near the
+        # spot comes or goes.
+        best = min(self.free, key=self.distance, default=None)
+        bound = self.distance(best) if best is not None else None
+        for spot in sorted(self.unknown, key=self.distance):
+
+            if bound is not None and self.distance(spot) >= bound:
+                break
+            self.unknown.discard(spot)
+
+            if not self.placement.blocked(spot[0], spot[1], self.clearance):
+                self.free.add(spot)
+                return spot
+        return best
+
+    def distance(self, spot):
+        return (spot[0] - self.placement.centre_x) ** 2 + (spot[1] - self.placement.centre_y) ** 2, spot
+
+class CentrePlacement:
+
+    def __init__(self, centre_x, centre_y, max_radius=150, margin=0.01, cell_size=30):
+        # The occupancy grid and the spots outlive a call: each placement
+        # only files the coins that arrived, moved or left since the last
+        # one. Each coin is also filed under the 3x3 block of cells around
+        # its own, so a spot is checked with a single lookup when the
+        # clearance is no wider than a cell.
+        self.centre_x = centre_x
+        self.centre_y = centre_y
+        self.max_radius = max_radius
+        self.margin = margin
+        self.cell_size = cell_size
+        self.cells = {}
+        self.around = {}
+        self.positions = set()
+        self.spots = {}
+
+    def cell(self, x, y):
+        return int(x // self.cell_size), int(y // self.cell_size)
+
+    def update(self, coins):
+        # Only coins that could block or shape a spot within max_radius are
+        # indexed.
+        limit = self.max_radius + self.cell_size
+        positions = set()
+        for coin in coins:
+
+            if coin.pocketed:
+                continue
+            x = coin.x
+            y = coin.y
+
+            if abs(x - self.centre_x) <= limit and abs(y - self.centre_y) <= limit:
+                positions.add((x, y))
+        for position in self.positions - positions:
+            column, row = self.cell(*position)
+            self.cells[column, row].remove(position)
+
+            if not self.cells[column, row]:
+                del self.cells[column, row]
+            for key in self.block(column, row):
+                self.around[key].remove(position)
+
+                if not self.around[key]:
+                    del self.around[key]
+        for position in positions - self.positions:
+            column, row = self.cell(*position)
+            self.cells.setdefault((column, row), []).append(position)
+            for key in self.block(column, row):
+                self.around.setdefault(key, []).append(position)
+        self.positions = positions
+
+    def block(self, column, row):
+        return [(i, j) for i in range(column - 1, column + 2) for j in range(row - 1, row + 2)]
+
+    def nearby(self, x, y, distance):
+        span = math.ceil(distance / self.cell_size)
+        column, row = self.cell(x, y)
+        found = []
+        for i in range(column - span, column + span + 1):
+            for j in range(row - span, row + span + 1):
+                found.extend(self.cells.get((i, j), ()))
+        return found
+
+    def blocked(self, x, y, clearance):
+        limit = clearance * clearance
+
+        if clearance <= self.cell_size:
+            coins = self.around.get((int(x // self.cell_size), int(y // self.cell_size)), ())
+        else:
+            coins = self.nearby(x, y, clearance)
+        for coin_x, coin_y in coins:
+
+            if (x - coin_x) ** 2 + (y - coin_y) ** 2 < limit:
+                return True
+        return False
+
+    def gap(self, x, y):
+        return min((math.hypot(x - coin_x, y - coin_y) for coin_x, coin_y in self.positions), default=math.inf)
+
+    def place(self, coins, clearance):
+        self.update(coins)
+
+        # Once most of the board has moved, starting over is cheaper than
+        # unpicking the old spots coin by coin.
+        spots = self.spots.get(clearance)
+
+        if spots is None or len(spots.positions - self.positions) * 2 > len(spots.positions):
+            spots = self.spots[clearance] = CentreSpots(self, clearance)
+        spots.sync()
+        spot = spots.nearest()
+
+        if spot is not None:
+            return spot
+        # Nothing within max_radius is clear; settle for the least crowded
+        # spot so a coin is always placed.
+        return max(sorted(spots.counts, key=spots.distance), key=lambda spot: self.gap(*spot))
@@ -0,0 +1,81 @@
+import collections
+import hashlib
+import threading
+
+POSITION_QUANTUM = 0.25
+ANGLE_DIGITS = 4
+POWER_DIGITS = 2
+
+def quantize(value, quantum=POSITION_QUANTUM):
+    return int(round(value / quantum))
+
+def canonical_coins(coins):
+    return sorted((coin for coin in coins if not coin.get('pocketed')),
+                  key=lambda coin: (coin['type'], quantize(coin['x']), quantize(coin['y'])))
+
+def board_hash(coins, striker_x=None, current_player=0, queen_covered=(False, False)):
+    key = (
+        tuple((coin['type'], quantize(coin['x']), quantize(coin['y'])) for coin in canonical_coins(coins)),
+        None if striker_x is None else quantize(striker_x),
+        current_player,
+        tuple(bool(flag) for flag in queen_covered)
+    )
+    return hashlib.blake2b(repr(key).encode(), digest_size=16).hexdigest()
+
+def shot_key(board, shot):
+    striker_x, angle, power = shot
+    return board, quantize(striker_x), round(angle, ANGLE_DIGITS), round(power, POWER_DIGITS)
+
+class ShotCache:
+
+    def __init__(self, max_size=4096):
+        self.max_size = max_size
+        self.entries = collections.OrderedDict()
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self.entries)
+
+    def get(self, board, shot):
+        key = shot_key(board, shot)
+
+        with self.lock:
+            outcome = self.entries.get(key)
+
+            if outcome is None:
+                self.misses += 1
+                return None
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return outcome
+
+    def put(self, board, shot, outcome):
+        key = shot_key(board, shot)
+
+        with self.lock:
+            self.entries[key] = outcome
+            self.entries.move_to_end(key)
+
+            while len(self.entries) > self.max_size:
+                self.entries.popitem(last=False)
+
+    def clear(self):
+
+        with self.lock:
+            self.entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self):
+
+        with self.lock:
+            lookups = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'size': len(self.entries),
+                'max_size': self.max_size,
+                'hit_rate': self.hits / lookups if lookups else 0.0
+            }
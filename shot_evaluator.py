@@ -0,0 +1,80 @@
+import concurrent.futures
+import math
+import os
+
+from physics import BoardSimulation, STRIKER_Y
+
+MAX_POWER = 35
+worker_board = None
+
+def board_coins(snapshot):
+    coins = []
+    for coin in snapshot['coins']:
+        coins.append({
+            'x': coin['x'],
+            'y': coin['y'],
+            'vx': coin.get('vx', 0.0),
+            'vy': coin.get('vy', 0.0),
+            'type': coin['type'],
+            'pocketed': coin.get('pocketed', False)
+        })
+    return coins
+
+def shot_velocity(angle, power):
+    # Angles follow the canvas, so straight up the board is -pi / 2.
+    power = min(power, MAX_POWER)
+    return power * math.cos(angle), power * math.sin(angle)
+
+def simulate_shot(simulation, coins, shot):
+    striker_x, angle, power = shot
+    simulation.reset(coins, striker_x, STRIKER_Y)
+    simulation.strike(*shot_velocity(angle, power))
+    events = simulation.run_events()
+    striker = simulation.striker
+    return {
+        'shot': tuple(shot),
+        'coins': [(coin['x'], coin['y']) for coin in simulation.coins],
+        'pocketed': [event[1] for event in events if event[0] == 'coin_pocketed'],
+        'foul': any(event[0] == 'striker_pocketed' for event in events),
+        'striker': (striker['x'], striker['y']),
+        'ticks': simulation.ticks
+    }
+
+def init_worker(snapshot):
+    global worker_board
+    worker_board = (BoardSimulation(), board_coins(snapshot))
+
+def evaluate_in_worker(shot):
+    simulation, coins = worker_board
+    return simulate_shot(simulation, coins, shot)
+
+class ShotEvaluator:
+
+    def __init__(self, snapshot, workers=None):
+        # The board goes to each worker once through the initializer; jobs
+        # after that only carry (striker_x, angle, power).
+        self.workers = workers or os.cpu_count() or 1
+        self.executor = concurrent.futures.ProcessPoolExecutor(
+            max_workers=self.workers,
+            initializer=init_worker,
+            initargs=(snapshot,)
+        )
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def evaluate(self, shots):
+        shots = [tuple(shot) for shot in shots]
+        chunksize = max(1, len(shots) // (self.workers * 4))
+        return list(self.executor.map(evaluate_in_worker, shots, chunksize=chunksize))
+
+    def close(self):
+        self.executor.shutdown()
+
+def evaluate_shots(snapshot, shots, workers=None):
+
+    with ShotEvaluator(snapshot, workers) as evaluator:
+        return evaluator.evaluate(shots)
@@ -0,0 +1,85 @@
+import math
+from PIL import Image, ImageDraw, ImageFont, ImageTk
+
+SHRINK_FRAMES = 8
+POCKET_SCALE = 0.6
+PULSE_STEPS = 21
+PULSE_AMPLITUDE = 10
+FADE_LEVELS = 6
+FONT_FILES = ("arialbd.ttf", "Arial Bold.ttf", "DejaVuSans-Bold.ttf")
+
+def pulse_sizes(base_size, steps=PULSE_STEPS):
+    return [base_size + int(PULSE_AMPLITUDE * math.sin(step * 0.5)) for step in range(steps)]
+
+def load_font(size):
+    for name in FONT_FILES:
+
+        try:
+            return ImageFont.truetype(name, size)
+
+        except OSError:
+            pass
+    return ImageFont.load_default(size)
+
+def render_text(text, size, fill):
+    font = load_font(size)
+    probe = ImageDraw.Draw(Image.new('RGBA', (1, 1)))
+    left, top, right, bottom = probe.multiline_textbbox((0, 0), text, font=font, align='center')
+    image = Image.new('RGBA', (right - left, bottom - top), (0, 0, 0, 0))
+    ImageDraw.Draw(image).multiline_text((-left, -top), text, font=font, fill=fill, align='center')
+    return image
+
+class SpriteCache:
+
+    def __init__(self, frames=SHRINK_FRAMES, pocket_scale=POCKET_SCALE):
+        # Everything is resized or rendered once, up front. Animations then
+        # only swap which PhotoImage an item shows.
+        self.frames = frames
+        self.pocket_scale = pocket_scale
+        self.sprites = {}
+        self.banners = {}
+        self.shades = {}
+
+    def add_sprite(self, name, image, size):
+        frames = []
+        for i in range(self.frames):
+            scale = 1 - (1 - self.pocket_scale) * i / (self.frames - 1)
+            side = max(1, round(size * scale))
+            frames.append(ImageTk.PhotoImage(image.resize((side, side), Image.Resampling.LANCZOS)))
+        self.sprites[name] = frames
+        return frames[0]
+
+    def sprite(self, name, progress=0.0):
+        frames = self.sprites[name]
+        return frames[min(len(frames) - 1, int(progress * len(frames)))]
+
+    def add_banner(self, name, text, base_size, fill, steps=PULSE_STEPS):
+
+        if name in self.banners:
+            return
+        rendered = {}
+        frames = []
+        for size in pulse_sizes(base_size, steps):
+
+            if size not in rendered:
+                rendered[size] = ImageTk.PhotoImage(render_text(text, size, fill))
+            frames.append(rendered[size])
+        self.banners[name] = frames
+
+    def add_shade(self, name, color, size, alpha, levels=FADE_LEVELS, peaks=()):
+        # Translucent full-board images, pre-blended at a few alpha levels.
+        # Each one is a full board of pixels, so keep the level count small.
+        # peaks adds frames for the lower alphas an overlay may stop at.
+        frames = []
+        for level in sorted({alpha * step / levels for step in range(1, levels + 1)} | set(peaks)):
+            image = Image.new('RGBA', size, color)
+            image.putalpha(round(255 * level))
+            frames.append((level, ImageTk.PhotoImage(image)))
+        self.shades[name] = frames
+
+    def shade(self, name, alpha=None):
+        frames = [(level, image) for level, image in self.shades[name] if alpha is None or level <= alpha + 1e-9]
+
+        if alpha is not None and (not frames or frames[-1][0] < alpha - 1e-9):
+            raise KeyError(f"no {alpha} frame for the {name} shade; pass it to add_shade as a peak")
+        return [image for level, image in frames]